@@ -12,6 +12,7 @@ from nado_protocol.engine_client.types.execute import (
 from nado_protocol.client.apis.base import NadoBaseAPI
 from nado_protocol.trigger_client.types.execute import (
     PlaceTriggerOrderParams,
+    PlaceTriggerOrdersParams,
     CancelTriggerOrdersParams,
     CancelProductTriggerOrdersParams,
 )
@@ -163,6 +164,11 @@ class MarketExecuteAPI(NadoBaseAPI):
             raise MissingTriggerClient()
         return self.context.trigger_client.place_trigger_order(params)
 
+    def place_trigger_orders(self, params: PlaceTriggerOrdersParams) -> ExecuteResponse:
+        if self.context.trigger_client is None:
+            raise MissingTriggerClient()
+        return self.context.trigger_client.place_trigger_orders(params)
+
     def cancel_trigger_orders(
         self, params: CancelTriggerOrdersParams
     ) -> ExecuteResponse:
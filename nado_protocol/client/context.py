@@ -8,7 +8,7 @@ from nado_protocol.contracts import NadoContracts, NadoContractsContext
 from eth_account.signers.local import LocalAccount
 from nado_protocol.engine_client import EngineClient
 from nado_protocol.engine_client.types import EngineClientOpts
-from nado_protocol.utils.backend import Signer
+from nado_protocol.utils.backend import Signer, create_session
 from nado_protocol.indexer_client import IndexerClient
 from nado_protocol.trigger_client import TriggerClient
 from nado_protocol.indexer_client.types import IndexerClientOpts
@@ -60,8 +60,10 @@ def create_nado_client_context(
     assert opts.indexer_endpoint_url is not None, "Missing indexer endpoint URL"
 
     signer = Account.from_key(signer) if isinstance(signer, str) else signer
+    # A single session lets all clients share pooled keep-alive connections
+    session = create_session()
     engine_client = EngineClient(
-        EngineClientOpts(url=opts.engine_endpoint_url, signer=signer)
+        EngineClientOpts(url=opts.engine_endpoint_url, signer=signer, session=session)
     )
     trigger_client = None
     try:
@@ -71,7 +73,9 @@ def create_nado_client_context(
 
         if opts.trigger_endpoint_url is not None:
             trigger_client = TriggerClient(
-                TriggerClientOpts(url=opts.trigger_endpoint_url, signer=signer)
+                TriggerClientOpts(
+                    url=opts.trigger_endpoint_url, signer=signer, session=session
+                )
             )
             trigger_client.endpoint_addr = contracts.endpoint_addr
             trigger_client.chain_id = int(contracts.chain_id)
@@ -85,6 +89,8 @@ def create_nado_client_context(
         signer=signer,
         engine_client=engine_client,
         trigger_client=trigger_client,
-        indexer_client=IndexerClient(IndexerClientOpts(url=opts.indexer_endpoint_url)),
+        indexer_client=IndexerClient(
+            IndexerClientOpts(url=opts.indexer_endpoint_url, session=session)
+        ),
         contracts=NadoContracts(opts.rpc_node_url, opts.contracts_context),
     )
@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Union
+from eth_abi import encode
 from eth_account.signers.local import LocalAccount
 from nado_protocol.contracts.eip712.domain import (
     get_eip712_domain_type,
@@ -8,10 +11,26 @@ from nado_protocol.contracts.eip712.types import (
     EIP712Types,
     get_nado_eip712_type,
 )
-from eth_account.messages import encode_typed_data
+from eth_account.messages import SignableMessage, encode_typed_data
+from eth_utils import keccak
+from hexbytes import HexBytes
 
 from nado_protocol.contracts.types import NadoTxType
 
+try:
+    # Private eth_account helpers, only used to cache hashes between messages.
+    # If they ever move, signing falls back to the public `encode_typed_data`.
+    from eth_account._utils.encode_typed_data.encoding_and_hashing import (
+        encode_field,
+        hash_domain,
+        hash_eip712_message,
+        hash_type,
+    )
+
+    _HAS_EIP712_HASH_HELPERS = True
+except ImportError:  # pragma: no cover
+    _HAS_EIP712_HASH_HELPERS = False
+
 
 def build_eip712_typed_data(
     tx: NadoTxType, msg: dict, verifying_contract: str, chain_id: int
@@ -31,9 +50,7 @@ def build_eip712_typed_data(
     Returns:
         EIP712TypedData: A structured data object that adheres to the EIP-712 standard.
     """
-    eip17_domain = get_nado_eip712_domain(verifying_contract, chain_id)
     eip712_tx_type = get_nado_eip712_type(tx)
-    eip712_primary_type = list(eip712_tx_type.keys())[0]
     eip712_types = EIP712Types(
         **{
             "EIP712Domain": get_eip712_domain_type(),
@@ -41,13 +58,95 @@ def build_eip712_typed_data(
         }
     )
     return EIP712TypedData(
-        domain=eip17_domain,
-        primaryType=eip712_primary_type,
+        domain=get_nado_eip712_domain(verifying_contract, chain_id),
+        primaryType=next(iter(eip712_tx_type)),
         types=eip712_types,
         message=msg,
     )
 
 
+@lru_cache(maxsize=32)
+def _hash_eip712_domain(
+    name: str, version: str, chain_id: int, verifying_contract: str
+) -> bytes:
+    """
+    Util to compute the EIP-712 domain separator, memoized since every Nado
+    message is signed against one of a handful of (verifying contract, chain) domains.
+    """
+    return hash_domain(
+        {
+            "name": name,
+            "version": version,
+            "chainId": chain_id,
+            "verifyingContract": verifying_contract,
+        }
+    )
+
+
+@lru_cache(maxsize=64)
+def _hash_eip712_struct_type(
+    primary_type: str, fields: tuple[tuple[str, str], ...]
+) -> bytes:
+    """
+    Util to compute the EIP-712 type hash of a struct without nested struct fields,
+    memoized since every Nado tx type is signed against the same struct definition.
+    """
+    return hash_type(
+        primary_type,
+        {primary_type: [{"name": name, "type": type_} for name, type_ in fields]},
+    )
+
+
+def _hash_eip712_message(typed_data: EIP712TypedData) -> bytes:
+    if not _HAS_EIP712_HASH_HELPERS:
+        return bytes(encode_typed_data(full_message=typed_data.dict()).body)
+
+    # Extra fields on EIP712Types hold the message types, i.e: all but EIP712Domain
+    message_types: dict[str, list[dict[str, str]]] = typed_data.types.model_extra or {}
+    if len(message_types) != 1:
+        return hash_eip712_message(message_types, typed_data.message)
+
+    # Nado messages are flat structs: equivalent to `hash_eip712_message`, but
+    # reuses the cached type hash instead of re-encoding the type on every message.
+    ((primary_type, fields),) = message_types.items()
+    encoded_types: list[str] = ["bytes32"]
+    encoded_values: list[Union[int, bytes]] = [
+        _hash_eip712_struct_type(
+            primary_type, tuple((field["name"], field["type"]) for field in fields)
+        )
+    ]
+    for field in fields:
+        encoded_type, encoded_value = encode_field(
+            message_types,
+            field["name"],
+            field["type"],
+            typed_data.message.get(field["name"]),
+        )
+        encoded_types.append(encoded_type)
+        encoded_values.append(encoded_value)
+    return bytes(keccak(encode(encoded_types, encoded_values)))
+
+
+def _encode_eip712_typed_data(typed_data: EIP712TypedData) -> SignableMessage:
+    """
+    Util to encode EIP-712 typed data into a signable message.
+
+    Equivalent to `eth_account.messages.encode_typed_data`, but reuses the
+    cached domain separator instead of re-hashing the domain for every message.
+    """
+    if not _HAS_EIP712_HASH_HELPERS:
+        return encode_typed_data(full_message=typed_data.dict())
+
+    domain = typed_data.domain
+    return SignableMessage(
+        HexBytes(b"\x01"),
+        _hash_eip712_domain(
+            domain.name, domain.version, domain.chainId, domain.verifyingContract
+        ),
+        _hash_eip712_message(typed_data),
+    )
+
+
 def get_eip712_typed_data_digest(typed_data: EIP712TypedData) -> str:
     """
     Util to get the EIP-712 typed data hash.
@@ -58,8 +157,7 @@ def get_eip712_typed_data_digest(typed_data: EIP712TypedData) -> str:
     Returns:
         str: The hexadecimal representation of the hash.
     """
-    signable = encode_typed_data(full_message=typed_data.dict())
-    return f"0x{signable.body.hex()}"
+    return f"0x{_hash_eip712_message(typed_data).hex()}"
 
 
 def sign_eip712_typed_data(typed_data: EIP712TypedData, signer: LocalAccount) -> str:
@@ -74,6 +172,6 @@ def sign_eip712_typed_data(typed_data: EIP712TypedData, signer: LocalAccount) ->
     Returns:
         str: The hexadecimal representation of the signature.
     """
-    signable = encode_typed_data(full_message=typed_data.dict())
+    signable = _encode_eip712_typed_data(typed_data)
     signed = signer.sign_message(signable)
     return signed.signature.hex()
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pydantic import BaseModel, ConfigDict
 from nado_protocol.contracts.types import NadoTxType
 
@@ -60,6 +61,21 @@ def get_nado_eip712_type(tx: NadoTxType) -> dict:
         dict: A dictionary containing the EIP712 type information for the given execute type.
     """
     return {
+        primary_type: [{"name": name, "type": type_} for name, type_ in fields]
+        for primary_type, fields in _get_nado_eip712_type_fields(tx)
+    }
+
+
+@lru_cache(maxsize=None)
+def _get_nado_eip712_type_fields(
+    tx: NadoTxType,
+) -> tuple[tuple[str, tuple[tuple[str, str], ...]], ...]:
+    """
+    Util that provides the EIP712 type information of a Nado execute type as
+    immutable `(struct, ((field name, field type), ...))` pairs, memoized so the
+    full table is only built once per tx type.
+    """
+    eip712_tx_type = {
         NadoTxType.PLACE_ORDER: {
             "Order": [
                 {"name": "sender", "type": "bytes32"},
@@ -145,3 +161,10 @@ def get_nado_eip712_type(tx: NadoTxType) -> dict:
             ]
         },
     }[tx]
+    return tuple(
+        (
+            primary_type,
+            tuple((field["name"], field["type"]) for field in fields),
+        )
+        for primary_type, fields in eip712_tx_type.items()
+    )
@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 from nado_protocol.contracts.types import (
     NadoAbiName,
@@ -8,6 +9,7 @@ from nado_protocol.contracts.types import (
 from nado_protocol.utils.model import ensure_data_type, parse_enum_value
 
 
+@lru_cache(maxsize=None)
 def load_abi(abi_name: NadoAbiName) -> list[dict]:
     """
     Load the Application Binary Interface (ABI) for a given contract.
@@ -17,6 +19,10 @@ def load_abi(abi_name: NadoAbiName) -> list[dict]:
 
     Returns:
         list[dict]: A list of dictionaries representing the ABI of the contract.
+
+    Note:
+        ABI files are read and parsed once per contract; the same list is
+        returned on subsequent calls and must not be mutated.
     """
     file_path = Path(__file__).parent / "abis" / f"{parse_enum_value(abi_name)}.json"
     return ensure_data_type(_load_json(file_path), list)
@@ -1,7 +1,7 @@
-import requests
 from functools import singledispatchmethod
 
 from typing import Optional, Union
+from nado_protocol.utils.backend import JSON_HEADERS, create_session
 from nado_protocol.engine_client.query import EngineQueryClient
 from nado_protocol.engine_client.types import (
     EngineClientOpts,
@@ -59,7 +59,7 @@ class EngineExecuteClient(NadoBaseExecute):
         self._querier = querier or EngineQueryClient(opts)
         self._opts: EngineClientOpts = EngineClientOpts.model_validate(opts)
         self.url: str = self._opts.url
-        self.session = requests.Session()
+        self.session = self._querier.session
 
     def tx_nonce(self, sender: str) -> int:
         """
@@ -114,7 +114,11 @@ class EngineExecuteClient(NadoBaseExecute):
             BadStatusCodeException: If the server response status code is not 200.
             ExecuteFailedException: If there's an error in the execution or the response status is not "success".
         """
-        res = self.session.post(f"{self.url}/execute", json=req.dict())
+        # Encoded by pydantic-core in one pass, rather than dumping to a dict
+        # and re-encoding it with the stdlib json module
+        res = self.session.post(
+            f"{self.url}/execute", data=req.json(), headers=JSON_HEADERS
+        )
         if res.status_code != 200:
             raise BadStatusCodeException(res.text)
         try:
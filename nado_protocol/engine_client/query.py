@@ -1,7 +1,7 @@
 import json
 from typing import Optional
-import requests
 
+from nado_protocol.utils.backend import create_session
 from nado_protocol.engine_client import EngineClientOpts
 from nado_protocol.engine_client.types.models import (
     MarketType,
@@ -76,7 +76,7 @@ class EngineQueryClient:
         self._opts: EngineClientOpts = EngineClientOpts.model_validate(opts)
         self.url: str = self._opts.url
         self.url_v2: str = self.url.replace("/v1", "") + "/v2"
-        self.session = requests.Session()  # type: ignore
+        self.session = self._opts.session or create_session()
 
     def query(self, req: QueryRequest) -> QueryResponse:
         """
@@ -1,6 +1,6 @@
 from typing import Optional, Union
-import requests
 from functools import singledispatchmethod
+from nado_protocol.utils.backend import create_session
 from nado_protocol.indexer_client.types import IndexerClientOpts
 from nado_protocol.indexer_client.types.models import MarketType
 from nado_protocol.indexer_client.types.query import (
@@ -71,7 +71,7 @@ class IndexerQueryClient:
         self._opts = IndexerClientOpts.model_validate(opts)
         self.url = self._opts.url
         self.url_v2: str = self.url.replace("/v1", "") + "/v2"
-        self.session = requests.Session()
+        self.session = self._opts.session or create_session()
 
     @singledispatchmethod
     def query(self, params: Union[IndexerParams, IndexerRequest]) -> IndexerResponse:
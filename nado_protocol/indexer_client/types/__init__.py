@@ -1,4 +1,6 @@
-from pydantic import BaseModel, AnyUrl, field_validator
+import requests
+from typing import Optional
+from pydantic import BaseModel, AnyUrl, ConfigDict, field_validator
 from nado_protocol.indexer_client.types.models import *
 from nado_protocol.indexer_client.types.query import *
 
@@ -9,6 +11,9 @@ class IndexerClientOpts(BaseModel):
     """
 
     url: AnyUrl
+    session: Optional[requests.Session] = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @field_validator("url")
     @classmethod
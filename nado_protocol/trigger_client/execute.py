@@ -1,11 +1,12 @@
-import requests
 from functools import singledispatchmethod
 from typing import Union, Optional, List, cast
+from nado_protocol.utils.backend import JSON_HEADERS, create_session
 from nado_protocol.contracts.types import NadoExecuteType
 from nado_protocol.trigger_client.types.execute import (
     TriggerExecuteParams,
     TriggerExecuteRequest,
     PlaceTriggerOrderParams,
+    PlaceTriggerOrdersParams,
     CancelTriggerOrdersParams,
     CancelProductTriggerOrdersParams,
     to_trigger_execute_request,
@@ -18,7 +19,7 @@ from nado_protocol.utils.exceptions import (
 )
 from nado_protocol.utils.execute import NadoBaseExecute, OrderParams
 from nado_protocol.utils.model import NadoBaseModel, is_instance_of_union
-from nado_protocol.utils.twap import create_twap_order
+from nado_protocol.utils.twap import create_twap_order, estimate_twap_completion_time
 from nado_protocol.utils.order import build_appendix, OrderAppendixTriggerType
 from nado_protocol.utils.expiration import OrderType, get_expiration_timestamp
 from nado_protocol.utils.nonce import gen_order_nonce
@@ -43,7 +44,7 @@ class TriggerExecuteClient(NadoBaseExecute):
         super().__init__(opts)
         self._opts: TriggerClientOpts = TriggerClientOpts.model_validate(opts)
         self.url: str = self._opts.url
-        self.session = requests.Session()
+        self.session = self._opts.session or create_session()
 
     def tx_nonce(self, _: str) -> int:
         raise NotImplementedError
@@ -94,7 +95,11 @@ class TriggerExecuteClient(NadoBaseExecute):
             BadStatusCodeException: If the server response status code is not 200.
             ExecuteFailedException: If there's an error in the execution or the response status is not "success".
         """
-        res = self.session.post(f"{self.url}/execute", json=req.dict())
+        # Encoded by pydantic-core in one pass, rather than dumping to a dict
+        # and re-encoding it with the stdlib json module
+        res = self.session.post(
+            f"{self.url}/execute", data=req.json(), headers=JSON_HEADERS
+        )
         if res.status_code != 200:
             raise BadStatusCodeException(res.text)
         try:
@@ -106,12 +111,36 @@ class TriggerExecuteClient(NadoBaseExecute):
         return execute_res
 
     def place_trigger_order(self, params: PlaceTriggerOrderParams) -> ExecuteResponse:
+        return self.execute(self._prepare_trigger_order(params))
+
+    def place_trigger_orders(self, params: PlaceTriggerOrdersParams) -> ExecuteResponse:
+        """
+        Places multiple trigger orders in a single request.
+
+        Each order is prepared and signed as in `place_trigger_order`, but all of them
+        are submitted with one `place_orders` execute instead of one request per order.
+
+        Args:
+            params (PlaceTriggerOrdersParams): The trigger orders to place and whether to stop on the first failure.
+
+        Returns:
+            ExecuteResponse: The response from placing the trigger orders, with one result per order.
+        """
+        params = PlaceTriggerOrdersParams.model_validate(params)
+        params.orders = [
+            self._prepare_trigger_order(order_params) for order_params in params.orders
+        ]
+        return self.execute(params)
+
+    def _prepare_trigger_order(
+        self, params: PlaceTriggerOrderParams
+    ) -> PlaceTriggerOrderParams:
         params = PlaceTriggerOrderParams.model_validate(params)
         params.order = self.prepare_execute_params(params.order, True)
         params.signature = params.signature or self._sign(
             NadoExecuteType.PLACE_ORDER, params.order.dict(), params.product_id
         )
-        return self.execute(params)
+        return params
 
     def place_twap_order(
         self,
@@ -160,7 +189,7 @@ class TriggerExecuteClient(NadoBaseExecute):
         # Backend requires: min_expiration <= expiration <= timestamp + 25 hours
         # Where min_expiration = ((times - 1) * interval) + now
         if expiration is None:
-            min_duration = (times - 1) * interval_seconds
+            min_duration = estimate_twap_completion_time(times, interval_seconds)
             max_duration = 60 * 60 * 25  # 25 hours in seconds
             # Set expiration to minimum duration + 1 hour buffer, capped at 25 hours
             buffer_duration = min(min_duration + 60 * 60, max_duration)
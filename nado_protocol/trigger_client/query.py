@@ -1,4 +1,4 @@
-import requests
+from nado_protocol.utils.backend import create_session
 from nado_protocol.contracts.types import NadoTxType
 from nado_protocol.trigger_client.types import TriggerClientOpts
 from nado_protocol.trigger_client.types.query import (
@@ -25,7 +25,7 @@ class TriggerQueryClient(NadoBaseExecute):
     def __init__(self, opts: TriggerClientOpts):
         self._opts: TriggerClientOpts = TriggerClientOpts.model_validate(opts)
         self.url: str = self._opts.url
-        self.session = requests.Session()  # type: ignore
+        self.session = self._opts.session or create_session()
 
     def tx_nonce(self, _: str) -> int:
         raise NotImplementedError
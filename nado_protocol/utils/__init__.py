@@ -10,6 +10,7 @@ from nado_protocol.utils.order import *
 __all__ = [
     "NadoBackendURL",
     "NadoClientOpts",
+    "create_session",
     "SubaccountParams",
     "Subaccount",
     "subaccount_to_bytes32",
@@ -53,4 +54,6 @@ __all__ = [
     "order_trigger_type",
     "order_twap_data",
     "order_execution_type",
+    "pack_appendices",
+    "unpack_appendices",
 ]
@@ -1,3 +1,5 @@
+import requests
+from requests.adapters import HTTPAdapter
 from nado_protocol.utils.enum import StrEnum
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
@@ -27,6 +29,34 @@ class NadoBackendURL(StrEnum):
 PrivateKey = str
 Signer = Union[LocalAccount, PrivateKey]
 
+# Headers for request bodies that are already JSON-encoded, e.g. by `NadoBaseModel.json`
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Max keep-alive connections per host; sized so concurrent callers sharing a
+# session don't fall back to opening throwaway connections.
+SESSION_POOL_MAXSIZE = 32
+
+
+def create_session(pool_maxsize: int = SESSION_POOL_MAXSIZE) -> requests.Session:
+    """
+    Creates the HTTP session used by Nado API clients.
+
+    The session keeps up to `pool_maxsize` connections per host alive, so
+    requests issued concurrently from multiple threads reuse established
+    TCP/TLS connections instead of opening new ones.
+
+    Args:
+        pool_maxsize (int): Maximum number of pooled connections per host.
+
+    Returns:
+        requests.Session: A session with pooled adapters mounted for http and https.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 class NadoClientOpts(BaseModel):
     """
@@ -39,6 +69,8 @@ class NadoClientOpts(BaseModel):
         linked_signer (Optional[Signer]): An optional signer linked the main subaccount to perform executes on it's behalf.
         chain_id (Optional[int]): An optional network chain ID.
         endpoint_addr (Optional[str]): Nado's endpoint address used for verifying executes.
+        session (Optional[requests.Session]): An optional HTTP session to send requests through, e.g. to share
+        pooled connections between clients. A new one is created via `create_session` if not provided.
 
     Notes:
         - The class also includes several methods for validating and sanitizing the input values.
@@ -50,6 +82,7 @@ class NadoClientOpts(BaseModel):
     linked_signer: Optional[Signer] = None
     chain_id: Optional[int] = None
     endpoint_addr: Optional[str] = None
+    session: Optional[requests.Session] = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
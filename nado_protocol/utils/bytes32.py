@@ -40,13 +40,12 @@ def hex_to_bytes(input: Union[str, bytes], size: int) -> bytes:
     """
     if isinstance(input, bytes):
         return input
-    if input.encode() == zero_subaccount():
+    # Only a string of 32 NUL characters encodes to the zero subaccount
+    if input == "\x00" * 32:
         return zero_subaccount()
     if input.startswith("0x"):
         input = input[2:]
-    data_bytes = bytes.fromhex(input)
-    padded_data = data_bytes + b"\x00" * (size - len(data_bytes))
-    return padded_data
+    return bytes.fromhex(input).ljust(size, b"\x00")
 
 
 def str_to_hex(input: str) -> str:
@@ -88,8 +87,8 @@ def subaccount_to_bytes32(
             name = name.hex() if isinstance(name, bytes) else name
             return hex_to_bytes32(subaccount + str_to_hex(name))
     elif isinstance(subaccount, SubaccountParams):
-        subaccount_owner = subaccount.dict().get("subaccount_owner")
-        subaccount_name = subaccount.dict().get("subaccount_name")
+        subaccount_owner = subaccount.subaccount_owner
+        subaccount_name = subaccount.subaccount_name
         if subaccount_owner is None or subaccount_name is None:
             raise ValueError("Missing `subaccount_owner` or `subaccount_name`")
         else:
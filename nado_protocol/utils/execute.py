@@ -1,5 +1,4 @@
 from abc import abstractmethod
-from copy import deepcopy
 from typing import Optional, Type, Union
 from eth_account.signers.local import LocalAccount
 from pydantic import field_validator, ConfigDict
@@ -203,10 +202,16 @@ class NadoBaseExecute:
             Type[BaseParams]: The parameters with the owner injected if needed.
         """
         if isinstance(params.sender, SubaccountParams):
-            params.sender.subaccount_owner = (
-                params.sender.subaccount_owner or self.signer.address
+            # Replaces rather than mutates the sender, which is shared with the
+            # caller's params (see `prepare_execute_params`)
+            params.sender = params.serialize_sender(
+                params.sender.model_copy(
+                    update={
+                        "subaccount_owner": params.sender.subaccount_owner
+                        or self.signer.address
+                    }
+                )
             )
-            params.sender = params.serialize_sender(params.sender)
         return params
 
     def _inject_nonce_if_needed(
@@ -242,7 +247,9 @@ class NadoBaseExecute:
         Returns:
             Type[BaseParams]: A copy of the original parameters with owner and nonce injected if needed.
         """
-        params = deepcopy(params)
+        # Fields are only reassigned on the copy, never mutated in place, so a
+        # shallow copy is enough to leave the caller's params untouched
+        params = params.model_copy()
         params = self._inject_owner_if_needed(params)
         params = self._inject_nonce_if_needed(params, use_order_nonce)
         return params
@@ -29,7 +29,10 @@ def calc_utilization_ratio(product: SpotProduct) -> float:
 
 
 def calc_borrow_rate_per_second(product: SpotProduct) -> float:
-    utilization = calc_utilization_ratio(product)
+    return _calc_borrow_rate_per_second(product, calc_utilization_ratio(product))
+
+
+def _calc_borrow_rate_per_second(product: SpotProduct, utilization: float) -> float:
     if utilization == 0:
         return 0
     interest_floor = from_x18(int(product.config.interest_floor_x18))
@@ -64,3 +67,20 @@ def calc_deposit_rate_in_period(
         return 0
     borrow_rate_in_period = calc_borrow_rate_in_period(product, period_in_seconds)
     return utilization * borrow_rate_in_period * (1 - interest_fee_fraction)
+
+
+def calc_deposit_and_borrow_rates_in_period(
+    product: SpotProduct, period_in_seconds: int, interest_fee_fraction: float
+) -> tuple[float, float]:
+    # Same as calc_deposit_rate_in_period + calc_borrow_rate_in_period, but derives
+    # utilization and the borrow rate from the product state only once.
+    utilization = calc_utilization_ratio(product)
+    if utilization == 0:
+        return (0, 0)
+    borrow_rate_in_period = (
+        _calc_borrow_rate_per_second(product, utilization) + 1
+    ) ** period_in_seconds - 1
+    deposit_rate_in_period = (
+        utilization * borrow_rate_in_period * (1 - interest_fee_fraction)
+    )
+    return (deposit_rate_in_period, borrow_rate_in_period)
@@ -1,6 +1,6 @@
 from typing import Optional
-from datetime import timezone, datetime, timedelta
 import random
+import time
 
 
 def gen_order_nonce(
@@ -19,11 +19,9 @@ def gen_order_nonce(
         int: The generated order nonce.
     """
     if recv_time_ms is None:
-        recv_time_ms = int(
-            (datetime.now(tz=timezone.utc) + timedelta(seconds=90)).timestamp() * 1000
-        )
+        recv_time_ms = time.time_ns() // 1_000_000 + 90_000
     if random_int is None:
-        random_int = random.randint(0, 999)
+        random_int = random.randrange(1000)
 
     nonce = (recv_time_ms << 20) + random_int
     return nonce
@@ -1,10 +1,12 @@
-from typing import Optional
+from array import array
+from functools import lru_cache
+from typing import Final, Iterable, Optional
 from enum import IntEnum
 from nado_protocol.utils.expiration import OrderType
 
 
 # Order appendix version
-APPENDIX_VERSION = 1
+APPENDIX_VERSION: Final = 1
 
 
 class AppendixBitFields:
@@ -13,31 +15,31 @@ class AppendixBitFields:
     # | 127..64 | 63..14   | 13..12  | 11          | 10..9     | 8        | 7..0    |
 
     # Bit positions (from LSB to MSB)
-    VERSION_BITS = 8  # bits 7..0
-    ISOLATED_BITS = 1  # bit 8
-    ORDER_TYPE_BITS = 2  # bits 10..9
-    REDUCE_ONLY_BITS = 1  # bit 11
-    TRIGGER_TYPE_BITS = 2  # bits 13..12
-    RESERVED_BITS = 50  # bits 63..14
-    VALUE_BITS = 64  # bits 127..64 (for isolated margin or TWAP data)
+    VERSION_BITS: Final = 8  # bits 7..0
+    ISOLATED_BITS: Final = 1  # bit 8
+    ORDER_TYPE_BITS: Final = 2  # bits 10..9
+    REDUCE_ONLY_BITS: Final = 1  # bit 11
+    TRIGGER_TYPE_BITS: Final = 2  # bits 13..12
+    RESERVED_BITS: Final = 50  # bits 63..14
+    VALUE_BITS: Final = 64  # bits 127..64 (for isolated margin or TWAP data)
 
     # Bit masks
-    VERSION_MASK = (1 << VERSION_BITS) - 1
-    ISOLATED_MASK = (1 << ISOLATED_BITS) - 1
-    ORDER_TYPE_MASK = (1 << ORDER_TYPE_BITS) - 1
-    REDUCE_ONLY_MASK = (1 << REDUCE_ONLY_BITS) - 1
-    TRIGGER_TYPE_MASK = (1 << TRIGGER_TYPE_BITS) - 1
-    RESERVED_MASK = (1 << RESERVED_BITS) - 1
-    VALUE_MASK = (1 << VALUE_BITS) - 1
+    VERSION_MASK: Final = (1 << VERSION_BITS) - 1
+    ISOLATED_MASK: Final = (1 << ISOLATED_BITS) - 1
+    ORDER_TYPE_MASK: Final = (1 << ORDER_TYPE_BITS) - 1
+    REDUCE_ONLY_MASK: Final = (1 << REDUCE_ONLY_BITS) - 1
+    TRIGGER_TYPE_MASK: Final = (1 << TRIGGER_TYPE_BITS) - 1
+    RESERVED_MASK: Final = (1 << RESERVED_BITS) - 1
+    VALUE_MASK: Final = (1 << VALUE_BITS) - 1
 
     # Bit shift positions
-    VERSION_SHIFT = 0
-    ISOLATED_SHIFT = 8
-    ORDER_TYPE_SHIFT = 9
-    REDUCE_ONLY_SHIFT = 11
-    TRIGGER_TYPE_SHIFT = 12
-    RESERVED_SHIFT = 14
-    VALUE_SHIFT = 64
+    VERSION_SHIFT: Final = 0
+    ISOLATED_SHIFT: Final = 8
+    ORDER_TYPE_SHIFT: Final = 9
+    REDUCE_ONLY_SHIFT: Final = 11
+    TRIGGER_TYPE_SHIFT: Final = 12
+    RESERVED_SHIFT: Final = 14
+    VALUE_SHIFT: Final = 64
 
 
 class OrderAppendixTriggerType(IntEnum):
@@ -50,23 +52,45 @@ class OrderAppendixTriggerType(IntEnum):
     TWAP_CUSTOM_AMOUNTS = 3
 
 
+_TWAP_TRIGGER_TYPES: Final = frozenset(
+    {OrderAppendixTriggerType.TWAP, OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS}
+)
+
+# Decoded enum members indexed by their raw appendix bits; indexing a tuple is
+# much cheaper than calling the Enum constructor on every accessor call.
+_ORDER_TYPES_BY_BITS: Final = tuple(
+    OrderType(bits) for bits in range(AppendixBitFields.ORDER_TYPE_MASK + 1)
+)
+_TRIGGER_TYPES_BY_BITS: Final = (None,) + tuple(
+    OrderAppendixTriggerType(bits)
+    for bits in range(1, AppendixBitFields.TRIGGER_TYPE_MASK + 1)
+)
+
+
 class TWAPBitFields:
     """Bit field definitions for TWAP value packing within the 64-bit value field."""
 
     # Bit layout (MSB → LSB): | times (32 bits) | slippage_x6 (32 bits) |
-    TIMES_BITS = 32
-    SLIPPAGE_BITS = 32
+    TIMES_BITS: Final = 32
+    SLIPPAGE_BITS: Final = 32
 
     # Bit masks
-    TIMES_MASK = (1 << TIMES_BITS) - 1
-    SLIPPAGE_MASK = (1 << SLIPPAGE_BITS) - 1
+    TIMES_MASK: Final = (1 << TIMES_BITS) - 1
+    SLIPPAGE_MASK: Final = (1 << SLIPPAGE_BITS) - 1
 
     # Bit shift positions (within the 64-bit value field)
-    SLIPPAGE_SHIFT = 0
-    TIMES_SHIFT = 32
+    SLIPPAGE_SHIFT: Final = 0
+    TIMES_SHIFT: Final = 32
 
     # Slippage scaling factor (6 decimal places)
-    SLIPPAGE_SCALE = 1_000_000
+    SLIPPAGE_SCALE: Final = 1_000_000
+
+
+# Precomputed for the inlined TWAP packing in `build_appendix`
+_SLIPPAGE_SCALE_FLOAT: Final = float(TWAPBitFields.SLIPPAGE_SCALE)
+_TWAP_TIMES_APPENDIX_SHIFT: Final = (
+    AppendixBitFields.VALUE_SHIFT + TWAPBitFields.TIMES_SHIFT
+)
 
 
 def pack_twap_appendix_value(times: int, slippage_frac: float) -> int:
@@ -103,6 +127,7 @@ def unpack_twap_appendix_value(value: int) -> tuple[int, float]:
     return int(times), slippage_frac
 
 
+@lru_cache(maxsize=64)
 def build_appendix(
     order_type: OrderType,
     isolated: bool = False,
@@ -130,26 +155,23 @@ def build_appendix(
 
     Raises:
         ValueError: If parameters are invalid or incompatible.
+
+    Note:
+        Results are memoized, since the same few flag combinations are built for most orders.
     """
+    trigger_value = 0 if trigger_type is None else int(trigger_type)
+    is_twap = trigger_value in _TWAP_TRIGGER_TYPES
+
     if isolated_margin is not None and not isolated:
         raise ValueError("isolated_margin can only be set when isolated=True")
 
-    if (
-        isolated
-        and trigger_type is not None
-        and trigger_type
-        in [OrderAppendixTriggerType.TWAP, OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS]
-    ):
+    if isolated and is_twap:
         raise ValueError("An order cannot be both isolated and a TWAP order")
 
-    if trigger_type is not None and trigger_type in [
-        OrderAppendixTriggerType.TWAP,
-        OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS,
-    ]:
-        if twap_times is None or twap_slippage_frac is None:
-            raise ValueError(
-                "twap_times and twap_slippage_frac are required for TWAP orders"
-            )
+    if is_twap and (twap_times is None or twap_slippage_frac is None):
+        raise ValueError(
+            "twap_times and twap_slippage_frac are required for TWAP orders"
+        )
 
     appendix = 0
 
@@ -174,7 +196,6 @@ def build_appendix(
         appendix |= 1 << AppendixBitFields.REDUCE_ONLY_SHIFT
 
     # Trigger type (bits 13..12) - default to 0 if None
-    trigger_value = 0 if trigger_type is None else int(trigger_type)
     appendix |= (
         trigger_value & AppendixBitFields.TRIGGER_TYPE_MASK
     ) << AppendixBitFields.TRIGGER_TYPE_SHIFT
@@ -185,22 +206,23 @@ def build_appendix(
         appendix |= (
             isolated_margin & AppendixBitFields.VALUE_MASK
         ) << AppendixBitFields.VALUE_SHIFT
-    elif trigger_type is not None and trigger_type in [
-        OrderAppendixTriggerType.TWAP,
-        OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS,
-    ]:
+    elif is_twap:
         # TWAP value (bits 127..64) - 64 bits
         # These are guaranteed to be non-None due to validation above
         assert twap_times is not None
         assert twap_slippage_frac is not None
-        twap_value = pack_twap_appendix_value(twap_times, twap_slippage_frac)
+        # Inlined `pack_twap_appendix_value`; the packed value is always 64 bits
+        slippage_x6 = int(twap_slippage_frac * _SLIPPAGE_SCALE_FLOAT)
         appendix |= (
-            twap_value & AppendixBitFields.VALUE_MASK
-        ) << AppendixBitFields.VALUE_SHIFT
+            (twap_times & TWAPBitFields.TIMES_MASK) << _TWAP_TIMES_APPENDIX_SHIFT
+        ) | (
+            (slippage_x6 & TWAPBitFields.SLIPPAGE_MASK) << AppendixBitFields.VALUE_SHIFT
+        )
 
     return appendix
 
 
+@lru_cache(maxsize=None)
 def gen_order_verifying_contract(product_id: int) -> str:
     """
     Generates the order verifying contract address based on the product ID.
@@ -210,6 +232,9 @@ def gen_order_verifying_contract(product_id: int) -> str:
 
     Returns:
         str: The generated order verifying contract address in hexadecimal format.
+
+    Note:
+        Results are memoized, since it is derived for every order signed and there are only a few products.
     """
     be_bytes = product_id.to_bytes(20, byteorder="big", signed=False)
     return "0x" + be_bytes.hex()
@@ -304,12 +329,10 @@ def order_trigger_type(appendix: int) -> Optional[OrderAppendixTriggerType]:
     Returns:
         Optional[OrderAppendixTriggerType]: The trigger type, or None if no trigger is set.
     """
-    trigger_bits = (
-        appendix >> AppendixBitFields.TRIGGER_TYPE_SHIFT
-    ) & AppendixBitFields.TRIGGER_TYPE_MASK
-    if trigger_bits == 0:
-        return None
-    return OrderAppendixTriggerType(trigger_bits)
+    return _TRIGGER_TYPES_BY_BITS[
+        (appendix >> AppendixBitFields.TRIGGER_TYPE_SHIFT)
+        & AppendixBitFields.TRIGGER_TYPE_MASK
+    ]
 
 
 def order_twap_data(appendix: int) -> Optional[tuple[int, float]]:
@@ -322,11 +345,7 @@ def order_twap_data(appendix: int) -> Optional[tuple[int, float]]:
     Returns:
         Optional[tuple[int, float]]: Tuple of (times, slippage_frac) if TWAP, None otherwise.
     """
-    trigger_type = order_trigger_type(appendix)
-    if trigger_type is not None and trigger_type in [
-        OrderAppendixTriggerType.TWAP,
-        OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS,
-    ]:
+    if order_trigger_type(appendix) in _TWAP_TRIGGER_TYPES:
         twap_value = (
             appendix >> AppendixBitFields.VALUE_SHIFT
         ) & AppendixBitFields.VALUE_MASK
@@ -344,7 +363,60 @@ def order_execution_type(appendix: int) -> OrderType:
     Returns:
         OrderType: The order execution type.
     """
-    order_type_bits = (
-        appendix >> AppendixBitFields.ORDER_TYPE_SHIFT
-    ) & AppendixBitFields.ORDER_TYPE_MASK
-    return OrderType(order_type_bits)
+    return _ORDER_TYPES_BY_BITS[
+        (appendix >> AppendixBitFields.ORDER_TYPE_SHIFT)
+        & AppendixBitFields.ORDER_TYPE_MASK
+    ]
+
+
+def pack_appendices(appendices: Iterable[int]) -> tuple[array, array]:
+    """
+    Packs many appendix values into a columnar representation for storage or transport.
+
+    The flag bits (bits 13..0) are stored in a 16-bit column and the value field
+    (bits 127..64) in a 64-bit column, so each field can be processed in bulk
+    without materializing 128-bit integers.
+
+    Args:
+        appendices (Iterable[int]): The order appendix values to pack.
+
+    Returns:
+        tuple[array, array]: The flags column (typecode "H") and the value column (typecode "Q").
+
+    Raises:
+        ValueError: If an appendix has reserved bits set or does not fit in 128 bits.
+    """
+    flags_mask = (1 << AppendixBitFields.RESERVED_SHIFT) - 1
+    reserved_mask = AppendixBitFields.RESERVED_MASK << AppendixBitFields.RESERVED_SHIFT
+    flags = array("H")
+    values = array("Q")
+    for appendix in appendices:
+        if appendix & reserved_mask or appendix >> 128:
+            raise ValueError(f"Appendix {appendix} cannot be packed")
+        flags.append(appendix & flags_mask)
+        values.append(appendix >> AppendixBitFields.VALUE_SHIFT)
+    return flags, values
+
+
+def unpack_appendices(flags: array, values: array) -> list[int]:
+    """
+    Reconstructs appendix values from the columns produced by `pack_appendices`.
+
+    Args:
+        flags (array): The flags column (bits 13..0 of each appendix).
+        values (array): The value column (bits 127..64 of each appendix).
+
+    Returns:
+        list[int]: The original appendix values.
+
+    Raises:
+        ValueError: If the columns have different lengths.
+    """
+    if len(flags) != len(values):
+        raise ValueError(
+            f"Column length mismatch: {len(flags)} flags, {len(values)} values"
+        )
+    return [
+        (value << AppendixBitFields.VALUE_SHIFT) | flag
+        for flag, value in zip(flags, values)
+    ]
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 from nado_protocol.utils.order import (
     build_appendix,
     OrderAppendixTriggerType,
@@ -10,8 +10,8 @@ from nado_protocol.utils.execute import OrderParams
 def create_twap_order(
     product_id: int,
     sender: str,
-    price_x18: str,
-    total_amount_x18: str,
+    price_x18: Union[str, int],
+    total_amount_x18: Union[str, int],
     expiration: int,
     nonce: int,
     times: int,
@@ -28,8 +28,8 @@ def create_twap_order(
     Args:
         product_id (int): The product ID for the order.
         sender (str): The sender address (32 bytes hex).
-        price_x18 (str): The limit price multiplied by 1e18.
-        total_amount_x18 (str): The total amount to trade multiplied by 1e18 (signed, negative for sell).
+        price_x18 (Union[str, int]): The limit price multiplied by 1e18.
+        total_amount_x18 (Union[str, int]): The total amount to trade multiplied by 1e18 (signed, negative for sell).
         expiration (int): Order expiration timestamp.
         nonce (int): Order nonce.
         times (int): Number of TWAP executions (1-500).
@@ -110,7 +110,7 @@ def create_twap_order(
 
 
 def validate_twap_order(
-    total_amount_x18: str,
+    total_amount_x18: Union[str, int],
     times: int,
     custom_amounts_x18: Optional[List[str]] = None,
 ) -> None:
@@ -118,7 +118,8 @@ def validate_twap_order(
     Validate TWAP order parameters.
 
     Args:
-        total_amount_x18 (str): The total amount to trade multiplied by 1e18.
+        total_amount_x18 (Union[str, int]): The total amount to trade multiplied by 1e18.
+            Callers that already hold the parsed integer can pass it directly to skip re-parsing.
         times (int): Number of TWAP executions.
         custom_amounts_x18 (Optional[List[str]]): Custom amounts for each execution multiplied by 1e18.
 
@@ -129,7 +130,7 @@ def validate_twap_order(
 
     if custom_amounts_x18 is None:
         # For equal distribution, total amount must be divisible by times
-        if total_amount_int % times != 0:
+        if total_amount_int % times:
             raise ValueError(
                 f"Total amount {total_amount_x18} must be divisible by times {times} "
                 f"for equal distribution TWAP orders"
@@ -164,6 +165,33 @@ def estimate_twap_completion_time(times: int, interval_seconds: int) -> int:
     return (times - 1) * interval_seconds
 
 
+def twap_schedule(start_timestamp: int, times: int, interval_seconds: int) -> List[int]:
+    """
+    Compute the timestamp of each TWAP execution.
+
+    Args:
+        start_timestamp (int): Timestamp of the first execution in seconds.
+        times (int): Number of TWAP executions.
+        interval_seconds (int): Time interval between executions in seconds.
+
+    Returns:
+        List[int]: Execution timestamps in seconds, one per execution.
+
+    Raises:
+        ValueError: If interval_seconds is not positive.
+    """
+    if interval_seconds <= 0:
+        raise ValueError(f"Interval must be positive, got {interval_seconds}")
+
+    return list(
+        range(
+            start_timestamp,
+            start_timestamp + times * interval_seconds,
+            interval_seconds,
+        )
+    )
+
+
 def calculate_equal_amounts(total_amount_x18: str, times: int) -> List[str]:
     """
     Calculate equal amounts for TWAP executions.
@@ -178,12 +206,11 @@ def calculate_equal_amounts(total_amount_x18: str, times: int) -> List[str]:
     Raises:
         ValueError: If total amount is not divisible by times.
     """
-    total_amount_int = int(total_amount_x18)
+    amount_per_execution, remainder = divmod(int(total_amount_x18), times)
 
-    if total_amount_int % times != 0:
+    if remainder:
         raise ValueError(
             f"Total amount {total_amount_x18} is not divisible by times {times}"
         )
 
-    amount_per_execution = total_amount_int // times
     return [str(amount_per_execution)] * times
@@ -1,12 +1,20 @@
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
-from nado_protocol.client import NadoClientMode, client_mode_to_setup
+from nado_protocol.client import (
+    NadoClient,
+    NadoClientMode,
+    client_mode_to_setup,
+    create_nado_client,
+)
 
 load_dotenv()
 
 CLIENT_MODE: NadoClientMode = os.getenv("CLIENT_MODE")
 SIGNER_PRIVATE_KEY = os.getenv("SIGNER_PRIVATE_KEY")
 LINKED_SIGNER_PRIVATE_KEY = os.getenv("LINKED_SIGNER_PRIVATE_KEY")
+# 1: one-line response summaries, 2: full JSON responses
+SANITY_LOG_LEVEL = int(os.getenv("SANITY_LOG", "1"))
 
 assert CLIENT_MODE, "CLIENT_MODE not set! set via .env file"
 assert SIGNER_PRIVATE_KEY, "SIGNER_PRIVATE_KEY not set! set via .env file"
@@ -17,3 +25,12 @@ assert SIGNER_PRIVATE_KEY, "SIGNER_PRIVATE_KEY not set! set via .env file"
     TRIGGER_BACKEND_URL,
     NETWORK,
 ) = client_mode_to_setup(CLIENT_MODE)
+
+
+@lru_cache(maxsize=1)
+def get_client() -> NadoClient:
+    """
+    Returns a NadoClient shared by all sanity scripts running in this process,
+    so contract ABIs, providers and HTTP sessions are only set up once.
+    """
+    return create_nado_client(CLIENT_MODE, SIGNER_PRIVATE_KEY)
@@ -1,12 +1,14 @@
-from sanity import CLIENT_MODE, SIGNER_PRIVATE_KEY
-from nado_protocol.client import NadoClient, create_nado_client
+from sanity import get_client
+from sanity.utils import buffer_stdout, print_json
+from nado_protocol.client import NadoClient
 from nado_protocol.utils.math import to_x18
 from nado_protocol.contracts.types import ClaimTokensParams
 
 
 def run():
+    buffer_stdout()
     print("setting up nado client...")
-    client: NadoClient = create_nado_client(CLIENT_MODE, SIGNER_PRIVATE_KEY)
+    client: NadoClient = get_client()
     signer = client.context.signer
 
     print("network:", client.context.contracts.network)
@@ -80,9 +82,9 @@ def run():
         client.rewards._get_claim_foundation_rewards_contract_params(signer)
     )
 
-    print(
+    print_json(
         "foundation rewards contract params:",
-        claim_foundation_rewards_contract_params.json(indent=2),
+        claim_foundation_rewards_contract_params,
     )
 
     print("claiming foundation rewards...")
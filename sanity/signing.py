@@ -1,11 +1,11 @@
-from sanity import CLIENT_MODE, SIGNER_PRIVATE_KEY
+from sanity import get_client
 from nado_protocol.contracts.types import NadoTxType
 from nado_protocol.utils.bytes32 import subaccount_to_hex, subaccount_to_bytes32
 from nado_protocol.contracts.eip712.sign import (
     build_eip712_typed_data,
     sign_eip712_typed_data,
 )
-from nado_protocol.client import NadoClient, create_nado_client
+from nado_protocol.client import NadoClient
 
 
 import time
@@ -24,7 +24,7 @@ from nado_protocol.utils.time import now_in_millis
 
 def run():
     print("setting up nado client...")
-    client: NadoClient = create_nado_client(CLIENT_MODE, SIGNER_PRIVATE_KEY)
+    client: NadoClient = get_client()
 
     print("chain_id:", client.context.engine_client.get_contracts().chain_id)
 
@@ -58,9 +58,32 @@ def run():
         appendix=build_appendix(OrderType.DEFAULT),
         nonce=gen_order_nonce(),
     )
-    now = time.time()
+    order_msg = order.dict()
+    verifying_contract = client.context.engine_client.order_verifying_contract(1)
+    chain_id = client.context.engine_client.chain_id
+    signer = client.context.engine_client.linked_signer
+
+    start = time.perf_counter()
     signature = client.context.engine_client._sign(
-        "place_order", order.dict(), product_id=1
+        "place_order", order_msg, product_id=1
     )
-    elapsed_time = (time.time() - now) * 1000
+    elapsed_time = (time.perf_counter() - start) * 1000
     print("place order signature:", signature, "elapsed_time:", elapsed_time)
+
+    print("profiling place order signing...")
+    iterations = 100
+    build_time = sign_time = 0.0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        typed_data = build_eip712_typed_data(
+            NadoTxType.PLACE_ORDER, order_msg, verifying_contract, chain_id
+        )
+        built = time.perf_counter()
+        sign_eip712_typed_data(typed_data=typed_data, signer=signer)
+        build_time += built - start
+        sign_time += time.perf_counter() - built
+    print(
+        f"avg over {iterations} signatures:",
+        f"build typed data {build_time / iterations * 1000:.3f}ms,",
+        f"encode + sign {sign_time / iterations * 1000:.3f}ms",
+    )
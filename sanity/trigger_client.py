@@ -1,5 +1,11 @@
-import time
-from sanity import ENGINE_BACKEND_URL, SIGNER_PRIVATE_KEY, TRIGGER_BACKEND_URL
+from functools import partial
+from sanity import (
+    ENGINE_BACKEND_URL,
+    SANITY_LOG_LEVEL,
+    SIGNER_PRIVATE_KEY,
+    TRIGGER_BACKEND_URL,
+)
+from sanity.utils import fetch_concurrently, print_json
 from nado_protocol.engine_client import EngineClient
 from nado_protocol.engine_client.types import EngineClientOpts
 from nado_protocol.engine_client.types.execute import OrderParams
@@ -20,22 +26,35 @@ from nado_protocol.trigger_client.types.query import (
     ListTriggerOrdersTx,
     ListTwapExecutionsParams,
 )
+from nado_protocol.utils.backend import create_session
 from nado_protocol.utils.bytes32 import subaccount_to_hex
-from nado_protocol.utils.expiration import OrderType, get_expiration_timestamp
+from nado_protocol.utils.expiration import OrderType
 from nado_protocol.utils.order import OrderAppendixTriggerType, build_appendix
 from nado_protocol.utils.math import to_pow_10, to_x18
 from nado_protocol.utils.subaccount import SubaccountParams
-from nado_protocol.utils.time import now_in_millis
+from nado_protocol.utils.time import now_in_seconds
+
+PRICE_TRIGGER_APPENDIX = build_appendix(
+    OrderType.DEFAULT, trigger_type=OrderAppendixTriggerType.PRICE
+)
+ORDER_AMOUNT_X18 = to_pow_10(1, 17)
+TRIGGER_PRICE_X18 = str(to_x18(120_000))
 
 
 def run():
     print("setting up trigger client...")
+    # Both clients send their requests through the same pooled keep-alive session
+    session = create_session()
     client = TriggerClient(
-        opts=TriggerClientOpts(url=TRIGGER_BACKEND_URL, signer=SIGNER_PRIVATE_KEY)
+        opts=TriggerClientOpts(
+            url=TRIGGER_BACKEND_URL, signer=SIGNER_PRIVATE_KEY, session=session
+        )
     )
 
     engine_client = EngineClient(
-        opts=EngineClientOpts(url=ENGINE_BACKEND_URL, signer=SIGNER_PRIVATE_KEY)
+        opts=EngineClientOpts(
+            url=ENGINE_BACKEND_URL, signer=SIGNER_PRIVATE_KEY, session=session
+        )
     )
 
     contracts_data = engine_client.get_contracts()
@@ -43,19 +62,24 @@ def run():
     client.chain_id = contracts_data.chain_id
 
     print("placing trigger order...")
+    default_subaccount = SubaccountParams(
+        subaccount_owner=client.signer.address, subaccount_name="default"
+    )
+    sender = subaccount_to_hex(default_subaccount)
     order_price = 100_000
+    order_price_x18 = to_x18(order_price)
+    # One clock read covers the expirations and recv time of the orders below,
+    # which are all built within a few round-trips of each other
+    now = now_in_seconds()
+    expiration = now + 40
 
     product_id = 1
     order = OrderParams(
-        sender=SubaccountParams(
-            subaccount_owner=client.signer.address, subaccount_name="default"
-        ),
-        priceX18=to_x18(order_price),
-        amount=to_pow_10(1, 17),
-        expiration=get_expiration_timestamp(40),
-        appendix=build_appendix(
-            OrderType.DEFAULT, trigger_type=OrderAppendixTriggerType.PRICE
-        ),
+        sender=default_subaccount,
+        priceX18=order_price_x18,
+        amount=ORDER_AMOUNT_X18,
+        expiration=expiration,
+        appendix=PRICE_TRIGGER_APPENDIX,
         nonce=client.order_nonce(),
     )
     order_digest = client.get_order_digest(order, product_id)
@@ -66,45 +90,28 @@ def run():
         order=order,
         trigger=PriceTrigger(
             price_trigger=PriceTriggerData(
-                price_requirement=LastPriceAbove(last_price_above=str(to_x18(120_000)))
+                price_requirement=LastPriceAbove(last_price_above=TRIGGER_PRICE_X18)
             )
         ),
     )
     res = client.place_trigger_order(place_order)
-    print("trigger order result:", res.json(indent=2))
-
-    sender = subaccount_to_hex(order.sender)
+    print_json("trigger order result:", res)
 
     cancel_orders = CancelTriggerOrdersParams(
         sender=sender, productIds=[product_id], digests=[order_digest]
     )
     res = client.cancel_trigger_orders(cancel_orders)
-    print("cancel trigger order result:", res.json(indent=2))
+    print_json("cancel trigger order result:", res)
 
     product_id = 2
-    order = OrderParams(
-        sender=SubaccountParams(
-            subaccount_owner=client.signer.address, subaccount_name="default"
-        ),
-        priceX18=to_x18(order_price),
-        amount=to_pow_10(1, 17),
-        expiration=get_expiration_timestamp(40),
-        appendix=build_appendix(
-            OrderType.DEFAULT, trigger_type=OrderAppendixTriggerType.PRICE
-        ),
-        nonce=client.order_nonce(),
-    )
+    # Same order on another product; `model_copy` reuses the already validated
+    # fields instead of re-running validators
+    order = order.model_copy(update={"nonce": client.order_nonce()})
     order_digest = client.get_order_digest(order, product_id)
     print("order digest:", order_digest)
 
     place_order = PlaceTriggerOrderParams(
-        product_id=product_id,
-        order=order,
-        trigger=PriceTrigger(
-            price_trigger=PriceTriggerData(
-                price_requirement=LastPriceAbove(last_price_above=str(to_x18(120_000)))
-            )
-        ),
+        product_id=product_id, order=order, trigger=place_order.trigger
     )
     res = client.place_trigger_order(place_order)
 
@@ -112,43 +119,19 @@ def run():
     trigger_orders = client.list_trigger_orders(
         ListTriggerOrdersParams(
             tx=ListTriggerOrdersTx(
-                sender=SubaccountParams(
-                    subaccount_owner=client.signer.address, subaccount_name="default"
-                ),
-                recvTime=now_in_millis(90),
+                sender=default_subaccount,
+                recvTime=(now + 90) * 1000,
             ),
             pending=True,
             product_id=2,
         )
     )
-    print("trigger orders:", trigger_orders.json(indent=2))
+    print_json("trigger orders:", trigger_orders)
 
     print("\n" + "=" * 50)
     print("TWAP ORDER EXAMPLES")
     print("=" * 50)
 
-    # Example 1: Basic TWAP order using convenience method (with defaults)
-    print("\n1. Basic TWAP order (DCA strategy) - using defaults")
-    print("-" * 40)
-
-    twap_res = client.place_twap_order(
-        product_id=1,
-        price_x18=str(to_x18(52_000)),
-        total_amount_x18=str(to_pow_10(5, 18)),
-        times=10,
-        slippage_frac=0.005,
-        interval_seconds=3600,
-    )
-    print(f"TWAP order result: {twap_res.json(indent=2)}")
-
-    # Get the order digest to track executions
-    twap_order_digest = twap_res.data.digest
-    print(f"TWAP order digest: {twap_order_digest}")
-
-    # Example 2: TWAP order with custom amounts and subaccount parameters
-    print("\n2. TWAP order with custom amounts (using subaccount parameters)")
-    print("-" * 55)
-
     custom_amounts = [
         str(to_pow_10(2, 18)),
         str(to_pow_10(15, 17)),
@@ -157,90 +140,136 @@ def run():
     ]
     total_amount = str(to_pow_10(5, 18))
 
-    custom_twap_res = client.place_twap_order(
-        product_id=1,
-        price_x18=str(to_x18(51_000)),
-        total_amount_x18=total_amount,
-        times=4,
-        slippage_frac=0.01,
-        interval_seconds=2700,
-        custom_amounts_x18=custom_amounts,
-        subaccount_name="default",
+    # The examples within each section are independent of each other, so they
+    # are placed concurrently and their results printed in order afterwards.
+    twap_results = fetch_concurrently(
+        {
+            # Example 1: Basic TWAP order using convenience method (with defaults)
+            "basic": partial(
+                client.place_twap_order,
+                product_id=1,
+                price_x18=str(to_x18(52_000)),
+                total_amount_x18=str(to_pow_10(5, 18)),
+                times=10,
+                slippage_frac=0.005,
+                interval_seconds=3600,
+            ),
+            # Example 2: TWAP order with custom amounts and subaccount parameters
+            "custom": partial(
+                client.place_twap_order,
+                product_id=1,
+                price_x18=str(to_x18(51_000)),
+                total_amount_x18=total_amount,
+                times=4,
+                slippage_frac=0.01,
+                interval_seconds=2700,
+                custom_amounts_x18=custom_amounts,
+                subaccount_name="default",
+            ),
+            # Example 3: TWAP sell order with reduce_only
+            "reduce_only": partial(
+                client.place_twap_order,
+                product_id=1,
+                sender=sender,
+                price_x18=str(to_x18(48_000)),
+                total_amount_x18=str(-to_pow_10(3, 18)),
+                times=6,
+                slippage_frac=0.0075,
+                interval_seconds=1800,
+                reduce_only=True,
+            ),
+        }
     )
-    print(f"Custom TWAP order result: {custom_twap_res.json(indent=2)}")
 
-    # Example 3: TWAP sell order with reduce_only
+    print("\n1. Basic TWAP order (DCA strategy) - using defaults")
+    print("-" * 40)
+    twap_res = twap_results["basic"]
+    print_json("TWAP order result:", twap_res)
+
+    # Get the order digest to track executions
+    twap_order_digest = twap_res.data.digest
+    print(f"TWAP order digest: {twap_order_digest}")
+
+    print("\n2. TWAP order with custom amounts (using subaccount parameters)")
+    print("-" * 55)
+    custom_twap_res = twap_results["custom"]
+    print_json("Custom TWAP order result:", custom_twap_res)
+
     print("\n3. TWAP sell order (reduce-only position closing)")
     print("-" * 50)
-
-    reduce_twap_res = client.place_twap_order(
-        product_id=1,
-        price_x18=str(to_x18(48_000)),
-        total_amount_x18=str(-to_pow_10(3, 18)),
-        times=6,
-        slippage_frac=0.0075,
-        interval_seconds=1800,
-        reduce_only=True,
-    )
-    print(f"Reduce-only TWAP result: {reduce_twap_res.json(indent=2)}")
+    reduce_twap_res = twap_results["reduce_only"]
+    print_json("Reduce-only TWAP result:", reduce_twap_res)
 
     print("\n" + "=" * 50)
     print("PRICE TRIGGER ORDER EXAMPLES")
     print("=" * 50)
 
-    # Example 4: Stop-loss order using convenience method (with defaults)
+    price_trigger_results = fetch_concurrently(
+        {
+            # Example 4: Stop-loss order using convenience method (with defaults)
+            "stop_loss": partial(
+                client.place_price_trigger_order,
+                product_id=1,
+                price_x18=str(to_x18(45_000)),
+                amount_x18=str(-to_pow_10(1, 18)),
+                trigger_price_x18=str(to_x18(46_000)),
+                trigger_type="last_price_below",
+                reduce_only=True,
+            ),
+            # Example 5: Take-profit order
+            "take_profit": partial(
+                client.place_price_trigger_order,
+                product_id=1,
+                sender=sender,
+                price_x18=str(to_x18(55_000)),
+                amount_x18=str(-to_pow_10(1, 18)),
+                trigger_price_x18=str(to_x18(54_000)),
+                trigger_type="last_price_above",
+                reduce_only=True,
+            ),
+            # Example 6: Oracle-based trigger order
+            "oracle": partial(
+                client.place_price_trigger_order,
+                product_id=1,
+                sender=sender,
+                price_x18=str(to_x18(50_500)),
+                amount_x18=str(to_pow_10(1, 18)),
+                trigger_price_x18=str(to_x18(50_000)),
+                trigger_type="oracle_price_above",
+            ),
+            # Example 7: Mid price trigger order
+            "mid_price": partial(
+                client.place_price_trigger_order,
+                product_id=1,
+                sender=sender,
+                price_x18=str(to_x18(49_500)),
+                amount_x18=str(to_pow_10(5, 17)),
+                trigger_price_x18=str(to_x18(49_000)),
+                trigger_type="mid_price_below",
+            ),
+        }
+    )
+
+    stop_loss_res = price_trigger_results["stop_loss"]
+    take_profit_res = price_trigger_results["take_profit"]
+    oracle_trigger_res = price_trigger_results["oracle"]
+    mid_price_trigger_res = price_trigger_results["mid_price"]
+
     print("\n4. Stop-loss order (last price below) - using defaults")
     print("-" * 40)
+    print_json("Stop-loss order result:", stop_loss_res)
 
-    stop_loss_res = client.place_price_trigger_order(
-        product_id=1,
-        price_x18=str(to_x18(45_000)),
-        amount_x18=str(-to_pow_10(1, 18)),
-        trigger_price_x18=str(to_x18(46_000)),
-        trigger_type="last_price_below",
-        reduce_only=True,
-    )
-    print(f"Stop-loss order result: {stop_loss_res.json(indent=2)}")
-
-    # Example 5: Take-profit order
     print("\n5. Take-profit order (last price above)")
     print("-" * 40)
+    print_json("Take-profit order result:", take_profit_res)
 
-    take_profit_res = client.place_price_trigger_order(
-        product_id=1,
-        price_x18=str(to_x18(55_000)),
-        amount_x18=str(-to_pow_10(1, 18)),
-        trigger_price_x18=str(to_x18(54_000)),
-        trigger_type="last_price_above",
-        reduce_only=True,
-    )
-    print(f"Take-profit order result: {take_profit_res.json(indent=2)}")
-
-    # Example 6: Oracle-based trigger order
     print("\n6. Oracle price trigger order")
     print("-" * 35)
+    print_json("Oracle trigger order result:", oracle_trigger_res)
 
-    oracle_trigger_res = client.place_price_trigger_order(
-        product_id=1,
-        price_x18=str(to_x18(50_500)),
-        amount_x18=str(to_pow_10(1, 18)),
-        trigger_price_x18=str(to_x18(50_000)),
-        trigger_type="oracle_price_above",
-    )
-    print(f"Oracle trigger order result: {oracle_trigger_res.json(indent=2)}")
-
-    # Example 7: Mid price trigger order
     print("\n7. Mid price trigger order")
     print("-" * 30)
-
-    mid_price_trigger_res = client.place_price_trigger_order(
-        product_id=1,
-        price_x18=str(to_x18(49_500)),
-        amount_x18=str(to_pow_10(5, 17)),
-        trigger_price_x18=str(to_x18(49_000)),
-        trigger_type="mid_price_below",
-    )
-    print(f"Mid price trigger result: {mid_price_trigger_res.json(indent=2)}")
+    print_json("Mid price trigger result:", mid_price_trigger_res)
 
     print("\n" + "=" * 50)
     print("ADVANCED INTEGRATION SCENARIOS")
@@ -251,35 +280,42 @@ def run():
     print("-" * 30)
     print("Setting up: Stop-loss + Take-profit + DCA TWAP")
 
-    strategy_stop_loss = client.place_price_trigger_order(
-        product_id=1,
-        price_x18=str(to_x18(44_000)),
-        amount_x18=str(-to_pow_10(2, 18)),
-        trigger_price_x18=str(to_x18(45_000)),
-        trigger_type="last_price_below",
-        reduce_only=True,
-    )
-    print(f"Strategy stop-loss: {strategy_stop_loss.status}")
-
-    strategy_take_profit = client.place_price_trigger_order(
-        product_id=1,
-        price_x18=str(to_x18(58_000)),
-        amount_x18=str(-to_pow_10(2, 18)),
-        trigger_price_x18=str(to_x18(57_000)),
-        trigger_type="last_price_above",
-        reduce_only=True,
-    )
-    print(f"Strategy take-profit: {strategy_take_profit.status}")
-
-    strategy_dca = client.place_twap_order(
-        product_id=1,
-        price_x18=str(to_x18(52_000)),
-        total_amount_x18=str(to_pow_10(10, 18)),
-        times=20,
-        slippage_frac=0.005,
-        interval_seconds=1800,
+    strategy_results = fetch_concurrently(
+        {
+            "stop-loss": partial(
+                client.place_price_trigger_order,
+                product_id=1,
+                sender=sender,
+                price_x18=str(to_x18(44_000)),
+                amount_x18=str(-to_pow_10(2, 18)),
+                trigger_price_x18=str(to_x18(45_000)),
+                trigger_type="last_price_below",
+                reduce_only=True,
+            ),
+            "take-profit": partial(
+                client.place_price_trigger_order,
+                product_id=1,
+                sender=sender,
+                price_x18=str(to_x18(58_000)),
+                amount_x18=str(-to_pow_10(2, 18)),
+                trigger_price_x18=str(to_x18(57_000)),
+                trigger_type="last_price_above",
+                reduce_only=True,
+            ),
+            "DCA TWAP": partial(
+                client.place_twap_order,
+                product_id=1,
+                sender=sender,
+                price_x18=str(to_x18(52_000)),
+                total_amount_x18=str(to_pow_10(10, 18)),
+                times=20,
+                slippage_frac=0.005,
+                interval_seconds=1800,
+            ),
+        }
     )
-    print(f"Strategy DCA TWAP: {strategy_dca.status}")
+    for label, res in strategy_results.items():
+        print(f"Strategy {label}: {res.status}")
 
     print("\nComplete trading strategy deployed successfully!")
     print("- Stop-loss at $45k (protects downside)")
@@ -295,7 +331,7 @@ def run():
         twap_executions = client.list_twap_executions(
             ListTwapExecutionsParams(digest=twap_order_digest)
         )
-        print(f"TWAP executions response: {twap_executions.json(indent=2)}")
+        print_json("TWAP executions response:", twap_executions)
 
         if (
             hasattr(twap_executions.data, "executions")
@@ -303,12 +339,13 @@ def run():
         ):
             executions = twap_executions.data.executions
             print(f"\nFound {len(executions)} TWAP execution(s)")
-            for i, execution in enumerate(executions, 1):
-                print(f"  Execution {i}:")
-                print(f"    Execution ID: {execution.execution_id}")
-                print(f"    Scheduled time: {execution.scheduled_time}")
-                print(f"    Status: {execution.status}")
-                print(f"    Updated at: {execution.updated_at}")
+            if SANITY_LOG_LEVEL >= 2:
+                for i, execution in enumerate(executions, 1):
+                    print(f"  Execution {i}:")
+                    print(f"    Execution ID: {execution.execution_id}")
+                    print(f"    Scheduled time: {execution.scheduled_time}")
+                    print(f"    Status: {execution.status}")
+                    print(f"    Updated at: {execution.updated_at}")
         else:
             print("No TWAP executions found yet (executions happen at intervals)")
     except Exception as e:
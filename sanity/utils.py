@@ -0,0 +1,279 @@
+import atexit
+import json
+import sys
+import time
+from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError, to_json
+from sanity import SANITY_LOG_LEVEL
+from nado_protocol.client import NadoClient
+from nado_protocol.contracts.types import NadoExecuteType
+from nado_protocol.engine_client import EngineClient
+from nado_protocol.engine_client.types.execute import OrderParams, PlaceOrderParams
+from nado_protocol.engine_client.types.models import SpotProductBalance
+from nado_protocol.engine_client.types.query import SubaccountInfoData
+
+
+def wait_until(
+    predicate: Callable[[], bool],
+    timeout: float = 30,
+    initial_interval: float = 0.1,
+    max_interval: float = 1.0,
+    description: str = "condition",
+):
+    """
+    Polls `predicate` with exponential backoff until it returns True.
+
+    Args:
+        predicate (Callable[[], bool]): Condition to wait for.
+        timeout (float): Maximum number of seconds to wait. Defaults to 30.
+        initial_interval (float): First polling interval in seconds. Defaults to 0.1.
+        max_interval (float): Upper bound on the polling interval in seconds. Defaults to 1.0.
+        description (str): Human readable name of the condition, used in the timeout error.
+
+    Raises:
+        TimeoutError: If the predicate is still False after `timeout` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    interval = initial_interval
+    while not predicate():
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"timed out after {timeout}s waiting for {description}")
+        time.sleep(interval)
+        interval = min(interval * 2, max_interval)
+
+
+def fetch_concurrently(
+    queries: Dict[Hashable, Callable[[], Any]], max_workers: int = 8
+) -> Dict[Hashable, Any]:
+    """
+    Runs independent, blocking queries concurrently on a thread pool.
+
+    Args:
+        queries (Dict[Hashable, Callable[[], Any]]): Zero-argument callables keyed by label.
+        max_workers (int): Maximum number of queries in flight. Defaults to 8.
+
+    Returns:
+        Dict[Hashable, Any]: The result of each query, keyed by the same label.
+
+    Raises:
+        Exception: Re-raises the first failing query's exception.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {label: executor.submit(query) for label, query in queries.items()}
+        return {label: future.result() for label, future in futures.items()}
+
+
+class SubaccountSummaryView:
+    """
+    Caches a subaccount's engine summary for a short time so back-to-back reads
+    share one request. Call `invalidate` after any execute that changes the
+    subaccount's state.
+    """
+
+    def __init__(self, client: NadoClient, subaccount: str, max_age: float = 0.5):
+        self._client = client
+        self._subaccount = subaccount
+        self._max_age = max_age
+        self._summary: Optional[SubaccountInfoData] = None
+        self._fetched_at = 0.0
+
+    def fetch(self, max_age: Optional[float] = None) -> SubaccountInfoData:
+        """
+        Returns the subaccount summary, re-querying the engine if the cached one
+        is older than `max_age` seconds (defaults to the view's `max_age`).
+        """
+        max_age = self._max_age if max_age is None else max_age
+        now = time.monotonic()
+        if self._summary is None or now - self._fetched_at >= max_age:
+            self._summary = self._client.subaccount.get_engine_subaccount_summary(
+                self._subaccount
+            )
+            self._fetched_at = now
+        return self._summary
+
+    def invalidate(self):
+        """Drops the cached summary so the next `fetch` re-queries the engine."""
+        self._summary = None
+
+
+def wait_for_spot_balance(
+    subaccount_view: SubaccountSummaryView, product_id: int, timeout: float = 120
+) -> SpotProductBalance:
+    """
+    Waits until the subaccount holds a non-zero balance of a spot product, e.g.
+    for a deposit to be credited by the engine.
+
+    The engine client has no balance stream to subscribe to, so this polls the
+    subaccount summary with `wait_until`'s exponential backoff.
+
+    Args:
+        subaccount_view (SubaccountSummaryView): View over the subaccount to watch.
+        product_id (int): The spot product to wait for.
+        timeout (float): Maximum number of seconds to wait. Defaults to 120.
+
+    Returns:
+        SpotProductBalance: The first non-zero balance observed.
+    """
+    balance: Optional[SpotProductBalance] = None
+
+    def credited() -> bool:
+        nonlocal balance
+        balance = subaccount_view.fetch(max_age=0).parse_subaccount_balance(product_id)
+        return int(balance.balance.amount) != 0
+
+    wait_until(credited, timeout=timeout, description=f"product {product_id} balance")
+    assert balance is not None
+    return balance
+
+
+def jdump(value: Any) -> str:
+    """
+    Formats a response as indented JSON for diagnostic printing.
+
+    Pydantic models, and lists or dicts of them, are serialized by
+    pydantic-core's native encoder (skipping None fields, like
+    `NadoBaseModel.json`). Only values it cannot serialize fall back to the
+    stdlib encoder.
+
+    Args:
+        value (Any): A pydantic model, or any JSON-serializable value.
+
+    Returns:
+        str: The indented JSON representation.
+    """
+    try:
+        return to_json(value, indent=2, exclude_none=True).decode()
+    except PydanticSerializationError:
+        pass
+    return json.dumps(
+        value,
+        indent=2,
+        default=lambda v: (
+            v.model_dump(mode="json", exclude_none=True)
+            if isinstance(v, BaseModel)
+            else str(v)
+        ),
+    )
+
+
+def presign_orders(
+    engine_client: EngineClient,
+    orders: Dict[Hashable, Tuple[int, OrderParams]],
+    max_workers: int = 4,
+) -> Dict[Hashable, PlaceOrderParams]:
+    """
+    Signs orders ahead of submission so `place_order` can skip inline signing.
+
+    Each order gets its owner and nonce injected, then its EIP-712 signature and
+    digest computed on a thread pool. The returned params can be submitted
+    as-is, and their `digest` used for later cancellations.
+
+    Args:
+        engine_client (EngineClient): Client whose signer, chain id and verifying contracts are used.
+        orders (Dict[Hashable, Tuple[int, OrderParams]]): `(product_id, order)` pairs keyed by label.
+        max_workers (int): Maximum number of orders signed concurrently. Defaults to 4.
+
+    Returns:
+        Dict[Hashable, PlaceOrderParams]: Signed place order params, keyed by the same label.
+    """
+
+    def presign(product_id: int, order: OrderParams) -> PlaceOrderParams:
+        order = engine_client.prepare_execute_params(order, True)
+        return PlaceOrderParams(
+            product_id=product_id,
+            order=order,
+            signature=engine_client.sign(
+                NadoExecuteType.PLACE_ORDER,
+                order.dict(),
+                engine_client.order_verifying_contract(product_id),
+                engine_client.chain_id,
+                engine_client.linked_signer,
+            ),
+            digest=engine_client.get_order_digest(order, product_id),
+        )
+
+    return fetch_concurrently(
+        {
+            label: partial(presign, product_id, order)
+            for label, (product_id, order) in orders.items()
+        },
+        max_workers=max_workers,
+    )
+
+
+def summarize(value: Any, max_length: int = 200) -> str:
+    """
+    Formats a response as a one-line summary for diagnostic printing.
+
+    Pydantic models list their scalar fields, while nested models and
+    collections are reduced to their type or size, so large responses (e.g.
+    engine markets or snapshots) are never walked in full.
+
+    Args:
+        value (Any): A pydantic model, a list, or any other value.
+        max_length (int): Maximum length of the summary. Defaults to 200.
+
+    Returns:
+        str: The summary, truncated to `max_length` characters.
+    """
+    if isinstance(value, BaseModel):
+        fields = []
+        for name, field_value in value:
+            if field_value is None:
+                continue
+            if isinstance(field_value, (list, tuple, dict)):
+                fields.append(f"{name}=<{len(field_value)} items>")
+            elif isinstance(field_value, BaseModel):
+                fields.append(f"{name}=<{type(field_value).__name__}>")
+            elif isinstance(field_value, Enum):
+                fields.append(f"{name}={field_value.value!r}")
+            else:
+                fields.append(f"{name}={field_value!r}")
+        summary = f"{type(value).__name__}({', '.join(fields)})"
+    elif isinstance(value, (list, tuple)):
+        summary = f"<{len(value)} items>"
+    else:
+        summary = repr(value)
+    if len(summary) > max_length:
+        summary = summary[: max_length - 3] + "..."
+    return summary
+
+
+def print_json(label: str, value: Any):
+    """
+    Prints `value` after `label`: as indented JSON when running with
+    `SANITY_LOG>=2`, otherwise as a one-line `summarize` of it, so the full
+    response is only serialized when asked for.
+
+    Args:
+        label (str): Text printed before the value.
+        value (Any): A pydantic model, or any JSON-serializable value.
+    """
+    if SANITY_LOG_LEVEL >= 2:
+        print(label, jdump(value))
+    else:
+        print(label, summarize(value))
+
+
+_stdout_buffered = False
+
+
+def buffer_stdout():
+    """
+    Switches stdout to block buffering for the rest of the process, so the
+    many diagnostic prints of a sanity run are written in a few large chunks
+    instead of one write per line. Pending output is flushed on exit.
+
+    Only the first call has an effect, so running several sanity entry points
+    in one process doesn't stack up exit handlers.
+    """
+    global _stdout_buffered
+    if _stdout_buffered:
+        return
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    atexit.register(sys.stdout.flush)
+    _stdout_buffered = True
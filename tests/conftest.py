@@ -1,5 +1,7 @@
+from typing import Callable
 from unittest.mock import MagicMock, patch
 from eth_account import Account
+from eth_account.signers.local import LocalAccount
 import pytest
 import requests
 from nado_protocol.client import NadoClient, create_nado_client
@@ -12,12 +14,12 @@ from nado_protocol.trigger_client.types import TriggerClientOpts
 from nado_protocol.utils.bytes32 import hex_to_bytes32
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def url() -> str:
     return "http://example.com"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def private_keys() -> list[str]:
     return [
         "0x45917429615b8a68cd372c96f63092f3d672a0bc60202b188670354b89c43ae3",
@@ -25,6 +27,11 @@ def private_keys() -> list[str]:
     ]
 
 
+@pytest.fixture(scope="session")
+def signer(private_keys: list[str]) -> LocalAccount:
+    return Account.from_key(private_keys[0])
+
+
 @pytest.fixture
 def chain_id() -> int:
     return 1337
@@ -73,7 +80,7 @@ def owners() -> list[str]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def senders() -> list[str]:
     return [
         "0xBE3faCAE76A38c3b61492E57BF65ae0628c4A80864656661756c740000000000",
@@ -81,6 +88,11 @@ def senders() -> list[str]:
     ]
 
 
+@pytest.fixture(scope="session")
+def sender_b32(senders: list[str]) -> bytes:
+    return hex_to_bytes32(senders[0])
+
+
 @pytest.fixture
 def engine_client(
     url: str,
@@ -120,26 +132,27 @@ def trigger_client(
 @pytest.fixture
 def nado_client(
     mock_post: MagicMock,
+    ok_response: Callable[[dict], MagicMock],
     chain_id: int,
     endpoint_addr: str,
     private_keys: list[str],
 ) -> NadoClient:
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "data": {
-            "endpoint_addr": endpoint_addr,
-            "chain_id": chain_id,
-        },
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response(
+        {
+            "status": "success",
+            "data": {
+                "endpoint_addr": endpoint_addr,
+                "chain_id": chain_id,
+            },
+        }
+    )
     return create_nado_client("testing", private_keys[0])
 
 
 @pytest.fixture
 def nado_client_with_trigger(
     mock_post: MagicMock,
+    ok_response: Callable[[dict], MagicMock],
     chain_id: int,
     endpoint_addr: str,
     private_keys: list[str],
@@ -148,16 +161,15 @@ def nado_client_with_trigger(
     from pydantic import parse_obj_as
     from pydantic import AnyUrl
 
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "data": {
-            "endpoint_addr": endpoint_addr,
-            "chain_id": chain_id,
-        },
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response(
+        {
+            "status": "success",
+            "data": {
+                "endpoint_addr": endpoint_addr,
+                "chain_id": chain_id,
+            },
+        }
+    )
 
     context_opts = NadoClientContextOpts(
         trigger_endpoint_url=parse_obj_as(AnyUrl, "http://trigger.example.com")
@@ -290,66 +302,82 @@ def mock_load_abi() -> MagicMock:
 
 
 @pytest.fixture
-def mock_execute_response(mock_post: MagicMock) -> MagicMock:
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "error": None,
-    }
-    mock_post.return_value = mock_response
+def ok_response() -> Callable[[dict], MagicMock]:
+    def _ok_response(payload: dict) -> MagicMock:
+        return MagicMock(status_code=200, **{"json.return_value": payload})
+
+    return _ok_response
+
+
+@pytest.fixture
+def mock_execute_response(
+    mock_post: MagicMock,
+    ok_response: Callable[[dict], MagicMock],
+) -> MagicMock:
+    mock_post.return_value = ok_response(
+        {
+            "status": "success",
+            "error": None,
+        }
+    )
     return mock_post
 
 
 @pytest.fixture
-def mock_place_order_response(mock_post: MagicMock) -> MagicMock:
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "error": None,
-        "data": {"digest": "0x123"},
-    }
-    mock_post.return_value = mock_response
+def mock_place_order_response(
+    mock_post: MagicMock,
+    ok_response: Callable[[dict], MagicMock],
+) -> MagicMock:
+    mock_post.return_value = ok_response(
+        {
+            "status": "success",
+            "error": None,
+            "data": {"digest": "0x123"},
+        }
+    )
     return mock_post
 
 
 @pytest.fixture
-def mock_cancel_orders_response(mock_post: MagicMock) -> MagicMock:
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "error": None,
-        "data": {
-            "cancelled_orders": [
-                {
-                    "product_id": 1,
-                    "sender": 1,
-                    "price_x18": 2.8898e22,
-                    "amount": -10000000000000000,
-                    "expiration": 4611687701117784000,
-                    "nonce": 1,
-                    "unfilled_amount": -10000000000000000,
-                    "digest": "0x8efa3736d834718f755b57cee9ba75db315f66c66844150bd15efd641e62e9e6",
-                    "placed_at": "1686629287",
-                }
-            ]
-        },
-    }
-    mock_post.return_value = mock_response
+def mock_cancel_orders_response(
+    mock_post: MagicMock,
+    ok_response: Callable[[dict], MagicMock],
+) -> MagicMock:
+    mock_post.return_value = ok_response(
+        {
+            "status": "success",
+            "error": None,
+            "data": {
+                "cancelled_orders": [
+                    {
+                        "product_id": 1,
+                        "sender": 1,
+                        "price_x18": 2.8898e22,
+                        "amount": -10000000000000000,
+                        "expiration": 4611687701117784000,
+                        "nonce": 1,
+                        "unfilled_amount": -10000000000000000,
+                        "digest": "0x8efa3736d834718f755b57cee9ba75db315f66c66844150bd15efd641e62e9e6",
+                        "placed_at": "1686629287",
+                    }
+                ]
+            },
+        }
+    )
     return mock_post
 
 
 @pytest.fixture
-def mock_nonces(mock_post: MagicMock) -> MagicMock:
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "data": {"tx_nonce": 1, "order_nonce": 1},
-    }
-    mock_post.return_value = mock_response
+def mock_nonces(
+    mock_post: MagicMock,
+    ok_response: Callable[[dict], MagicMock],
+) -> MagicMock:
+    mock_post.return_value = ok_response(
+        {
+            "status": "success",
+            "data": {"tx_nonce": 1, "order_nonce": 1},
+        }
+    )
     return mock_post
 
 
@@ -367,13 +395,15 @@ def contracts_context(endpoint_addr: str, querier_addr: str) -> NadoContractsCon
 
 
 @pytest.fixture
-def mock_place_trigger_order_response(mock_post: MagicMock) -> MagicMock:
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "error": None,
-        "data": {"digest": "0xabc"},
-    }
-    mock_post.return_value = mock_response
+def mock_place_trigger_order_response(
+    mock_post: MagicMock,
+    ok_response: Callable[[dict], MagicMock],
+) -> MagicMock:
+    mock_post.return_value = ok_response(
+        {
+            "status": "success",
+            "error": None,
+            "data": {"digest": "0xabc"},
+        }
+    )
     return mock_post
@@ -1,9 +1,12 @@
-from eth_account import Account
+from eth_account.signers.local import LocalAccount
+from eth_account.messages import encode_typed_data
 from nado_protocol.contracts.eip712.domain import (
     get_eip712_domain_type,
     get_nado_eip712_domain,
 )
 from nado_protocol.contracts.eip712.sign import (
+    _hash_eip712_message,
+    _hash_eip712_struct_type,
     build_eip712_typed_data,
     get_eip712_typed_data_digest,
     sign_eip712_typed_data,
@@ -14,11 +17,18 @@ from nado_protocol.utils.order import gen_order_verifying_contract, build_append
 from nado_protocol.utils.expiration import OrderType
 import pytest
 
+import nado_protocol.contracts.eip712.sign as eip712_sign
+
+
+def _field_pairs(fields: list[dict]) -> tuple[tuple[str, str], ...]:
+    return tuple((field["name"], field["type"]) for field in fields)
+
 
 def test_order_verifying_contract():
     assert (
         gen_order_verifying_contract(18) == "0x0000000000000000000000000000000000000012"
     )
+    assert gen_order_verifying_contract(18) is gen_order_verifying_contract(18)
 
 
 def test_build_eip712_domain(
@@ -45,129 +55,122 @@ def test_build_eip712_domain(
     assert eip712_domain_endpoint_addr.verifyingContract == endpoint_addr
     assert eip712_order_domain_addr.verifyingContract == order_verifying_contracts[1]
 
-    assert eip712_domain_endpoint_addr.dict() == {
-        "name": "Nado",
-        "version": "0.0.1",
-        "chainId": chain_id,
-        "verifyingContract": endpoint_addr,
-    }
-    assert eip712_order_domain_addr.dict() == {
-        "name": "Nado",
-        "version": "0.0.1",
-        "chainId": chain_id,
-        "verifyingContract": order_verifying_contracts[1],
-    }
-
 
 @pytest.mark.parametrize(
-    "tx, primary_type, eip712_type",
+    "tx, primary_type, eip712_fields",
     [
         (
             NadoTxType.PLACE_ORDER,
             "Order",
-            [
-                {"name": "sender", "type": "bytes32"},
-                {"name": "priceX18", "type": "int128"},
-                {"name": "amount", "type": "int128"},
-                {"name": "expiration", "type": "uint64"},
-                {"name": "nonce", "type": "uint64"},
-                {"name": "appendix", "type": "uint128"},
-            ],
+            (
+                ("sender", "bytes32"),
+                ("priceX18", "int128"),
+                ("amount", "int128"),
+                ("expiration", "uint64"),
+                ("nonce", "uint64"),
+                ("appendix", "uint128"),
+            ),
         ),
         (
             NadoTxType.CANCEL_ORDERS,
             "Cancellation",
-            [
-                {"name": "sender", "type": "bytes32"},
-                {"name": "productIds", "type": "uint32[]"},
-                {"name": "digests", "type": "bytes32[]"},
-                {"name": "nonce", "type": "uint64"},
-            ],
+            (
+                ("sender", "bytes32"),
+                ("productIds", "uint32[]"),
+                ("digests", "bytes32[]"),
+                ("nonce", "uint64"),
+            ),
         ),
         (
             NadoTxType.CANCEL_PRODUCT_ORDERS,
             "CancellationProducts",
-            [
-                {"name": "sender", "type": "bytes32"},
-                {"name": "productIds", "type": "uint32[]"},
-                {"name": "nonce", "type": "uint64"},
-            ],
+            (
+                ("sender", "bytes32"),
+                ("productIds", "uint32[]"),
+                ("nonce", "uint64"),
+            ),
         ),
         (
             NadoTxType.WITHDRAW_COLLATERAL,
             "WithdrawCollateral",
-            [
-                {"name": "sender", "type": "bytes32"},
-                {"name": "productId", "type": "uint32"},
-                {"name": "amount", "type": "uint128"},
-                {"name": "nonce", "type": "uint64"},
-            ],
+            (
+                ("sender", "bytes32"),
+                ("productId", "uint32"),
+                ("amount", "uint128"),
+                ("nonce", "uint64"),
+            ),
         ),
         (
             NadoTxType.LIQUIDATE_SUBACCOUNT,
             "LiquidateSubaccount",
-            [
-                {"name": "sender", "type": "bytes32"},
-                {"name": "liquidatee", "type": "bytes32"},
-                {"name": "productId", "type": "uint32"},
-                {"name": "isEncodedSpread", "type": "bool"},
-                {"name": "amount", "type": "int128"},
-                {"name": "nonce", "type": "uint64"},
-            ],
+            (
+                ("sender", "bytes32"),
+                ("liquidatee", "bytes32"),
+                ("productId", "uint32"),
+                ("isEncodedSpread", "bool"),
+                ("amount", "int128"),
+                ("nonce", "uint64"),
+            ),
         ),
         (
             NadoTxType.MINT_NLP,
             "MintNlp",
-            [
-                {"name": "sender", "type": "bytes32"},
-                {"name": "quoteAmount", "type": "uint128"},
-                {"name": "nonce", "type": "uint64"},
-            ],
+            (
+                ("sender", "bytes32"),
+                ("quoteAmount", "uint128"),
+                ("nonce", "uint64"),
+            ),
         ),
         (
             NadoTxType.BURN_NLP,
             "BurnNlp",
-            [
-                {"name": "sender", "type": "bytes32"},
-                {"name": "nlpAmount", "type": "uint128"},
-                {"name": "nonce", "type": "uint64"},
-            ],
+            (
+                ("sender", "bytes32"),
+                ("nlpAmount", "uint128"),
+                ("nonce", "uint64"),
+            ),
         ),
         (
             NadoTxType.LINK_SIGNER,
             "LinkSigner",
-            [
-                {"name": "sender", "type": "bytes32"},
-                {"name": "signer", "type": "bytes32"},
-                {"name": "nonce", "type": "uint64"},
-            ],
+            (
+                ("sender", "bytes32"),
+                ("signer", "bytes32"),
+                ("nonce", "uint64"),
+            ),
         ),
         (
             NadoTxType.AUTHENTICATE_STREAM,
             "StreamAuthentication",
-            [
-                {"name": "sender", "type": "bytes32"},
-                {"name": "expiration", "type": "uint64"},
-            ],
+            (
+                ("sender", "bytes32"),
+                ("expiration", "uint64"),
+            ),
         ),
         (
             NadoTxType.LIST_TRIGGER_ORDERS,
             "ListTriggerOrders",
-            [
-                {"name": "sender", "type": "bytes32"},
-                {"name": "recvTime", "type": "uint64"},
-            ],
+            (
+                ("sender", "bytes32"),
+                ("recvTime", "uint64"),
+            ),
         ),
     ],
 )
 def test_build_eip712_types(
-    tx: NadoTxType, primary_type: str, eip712_type: list[dict]  # type: ignore
+    tx: NadoTxType,  # type: ignore
+    primary_type: str,
+    eip712_fields: tuple[tuple[str, str], ...],
 ):
     computed_eip712_type = get_nado_eip712_type(tx)
-    eip712_primary_type = list(computed_eip712_type.keys())[0]
+    eip712_primary_type = next(iter(computed_eip712_type))
+    computed_fields = next(iter(computed_eip712_type.values()))
 
     assert eip712_primary_type == primary_type
-    assert list(computed_eip712_type.values())[0] == eip712_type
+    assert _field_pairs(computed_fields) == eip712_fields
+    # Callers get their own copy, so mutating it can't affect later signatures
+    computed_fields.append({"name": "extra", "type": "uint64"})
+    assert _field_pairs(get_nado_eip712_type(tx)[primary_type]) == eip712_fields
 
 
 def test_build_eip712_domain_type():
@@ -292,74 +295,128 @@ def test_build_eip712_typed_data(
     eip712_typed_data = build_eip712_typed_data(
         tx, verifying_contract=endpoint_addr, chain_id=chain_id, msg=msg
     )
-    assert eip712_typed_data.dict() == {
-        "types": {
-            "EIP712Domain": [
-                {"name": "name", "type": "string"},
-                {"name": "version", "type": "string"},
-                {"name": "chainId", "type": "uint256"},
-                {"name": "verifyingContract", "type": "address"},
-            ],
-            primary_type: list(get_nado_eip712_type(tx).values())[0],
-        },
-        "primaryType": primary_type,
-        "domain": {
-            "name": "Nado",
-            "version": "0.0.1",
-            "chainId": chain_id,
-            "verifyingContract": endpoint_addr,
-        },
-        "message": msg,
-    }
+    assert eip712_typed_data.primaryType == primary_type
+    assert eip712_typed_data.message == msg
+    assert eip712_typed_data.types.EIP712Domain == get_eip712_domain_type()
+    assert eip712_typed_data.types.model_extra == get_nado_eip712_type(tx)
+    assert next(iter(eip712_typed_data.types.model_extra)) == primary_type
 
+    domain = eip712_typed_data.domain
+    assert domain.name == "Nado"
+    assert domain.version == "0.0.1"
+    assert domain.chainId == chain_id
+    assert domain.verifyingContract == endpoint_addr
 
+    # Each call builds its own domain and types, so mutating one typed data
+    # can't leak into the next
+    eip712_typed_data.domain.chainId += 1
+    eip712_typed_data.types.EIP712Domain.pop()
+    other_typed_data = build_eip712_typed_data(
+        tx, verifying_contract=endpoint_addr, chain_id=chain_id, msg={}
+    )
+    assert other_typed_data.domain.chainId == chain_id
+    assert other_typed_data.types.EIP712Domain == get_eip712_domain_type()
+    assert other_typed_data.message == {}
+
+
+@pytest.mark.parametrize(
+    "tx, params_fixture",
+    [
+        (NadoTxType.PLACE_ORDER, "order_params"),
+        (NadoTxType.CANCEL_ORDERS, "cancellation_params"),
+        (NadoTxType.CANCEL_PRODUCT_ORDERS, "cancellation_products_params"),
+        (NadoTxType.WITHDRAW_COLLATERAL, "withdraw_collateral_params"),
+        (NadoTxType.LIQUIDATE_SUBACCOUNT, "liquidate_subaccount_params"),
+        (NadoTxType.MINT_NLP, "mint_nlp_params"),
+        (NadoTxType.BURN_NLP, "burn_nlp_params"),
+        (NadoTxType.LINK_SIGNER, "link_signer_params"),
+        (NadoTxType.AUTHENTICATE_STREAM, "authenticate_stream_params"),
+        (NadoTxType.LIST_TRIGGER_ORDERS, "list_trigger_orders_params"),
+    ],
+)
 def test_sign_eip712_typed_data(
+    request: pytest.FixtureRequest,
+    tx: NadoTxType,  # type: ignore
+    params_fixture: str,
     chain_id: int,
     endpoint_addr: str,
     order_verifying_contracts: list[str],
-    private_keys: list[str],
+    signer: LocalAccount,
+):
+    msg = request.getfixturevalue(params_fixture)
+    verifying_contract = (
+        order_verifying_contracts[1] if tx == NadoTxType.PLACE_ORDER else endpoint_addr
+    )
+
+    eip712_typed_data = build_eip712_typed_data(tx, msg, verifying_contract, chain_id)
+    # raises an exception if signing fails
+    signature = sign_eip712_typed_data(eip712_typed_data, signer)
+    digest = get_eip712_typed_data_digest(eip712_typed_data)
+
+    # matches eth_account's own encoding of the full typed data
+    signable = encode_typed_data(full_message=eip712_typed_data.dict())
+    assert signature == signer.sign_message(signable).signature.hex()
+    assert digest == f"0x{signable.body.hex()}"
+
+    # the struct type hash is only computed once per tx type
+    hits = _hash_eip712_struct_type.cache_info().hits
+    get_eip712_typed_data_digest(eip712_typed_data)
+    assert _hash_eip712_struct_type.cache_info().hits == hits + 1
+
+
+def test_eip712_hash_helpers_available():
+    # Signing caches hashes through eth_account's private helpers; fail loudly if
+    # an eth-account upgrade moves them instead of silently taking the slow path.
+    assert eip712_sign._HAS_EIP712_HASH_HELPERS
+
+
+def test_sign_eip712_typed_data_without_hash_helpers(
+    monkeypatch: pytest.MonkeyPatch,
     order_params: dict,
-    cancellation_params: dict,
-    cancellation_products_params: dict,
-    withdraw_collateral_params: dict,
-    liquidate_subaccount_params: dict,
-    mint_nlp_params: dict,
-    burn_nlp_params: dict,
-    link_signer_params: dict,
-    authenticate_stream_params: dict,
-    list_trigger_orders_params: dict,
+    chain_id: int,
+    order_verifying_contracts: list[str],
+    signer: LocalAccount,
 ):
-    to_sign = [
-        (NadoTxType.PLACE_ORDER, order_verifying_contracts[1], order_params),
-        (NadoTxType.CANCEL_ORDERS, endpoint_addr, cancellation_params),
-        (
-            NadoTxType.CANCEL_PRODUCT_ORDERS,
-            endpoint_addr,
-            cancellation_products_params,
-        ),
-        (
-            NadoTxType.WITHDRAW_COLLATERAL,
-            endpoint_addr,
-            withdraw_collateral_params,
-        ),
-        (
-            NadoTxType.LIQUIDATE_SUBACCOUNT,
-            endpoint_addr,
-            liquidate_subaccount_params,
-        ),
-        (NadoTxType.MINT_NLP, endpoint_addr, mint_nlp_params),
-        (NadoTxType.BURN_NLP, endpoint_addr, burn_nlp_params),
-        (NadoTxType.LINK_SIGNER, endpoint_addr, link_signer_params),
-        (NadoTxType.AUTHENTICATE_STREAM, endpoint_addr, authenticate_stream_params),
-        (NadoTxType.LIST_TRIGGER_ORDERS, endpoint_addr, list_trigger_orders_params),
-    ]
+    eip712_typed_data = build_eip712_typed_data(
+        NadoTxType.PLACE_ORDER, order_params, order_verifying_contracts[1], chain_id
+    )
+    signature = sign_eip712_typed_data(eip712_typed_data, signer)
+    digest = get_eip712_typed_data_digest(eip712_typed_data)
 
-    signer = Account.from_key(private_keys[0])
+    monkeypatch.setattr(eip712_sign, "_HAS_EIP712_HASH_HELPERS", False)
+    assert sign_eip712_typed_data(eip712_typed_data, signer) == signature
+    assert get_eip712_typed_data_digest(eip712_typed_data) == digest
+
+
+_EIP712_SAMPLE_VALUES = {
+    "bytes32": "0x841fe4876763357975d60da128d8a54bb045d76a64656661756c740000000000",
+    "bytes32[]": ["0x51cef4bde4000cb4e26bd7d5d8bd7fa2cb61a08c5b4be2bb9ef1bbd8f5296e7b"],
+    "int128": -1000000000000000000,
+    "uint128": 20000000000000000000000,
+    "uint64": 4611687701117784255,
+    "uint32": 2,
+    "uint32[]": [2, 4],
+    "bool": True,
+}
+
+
+@pytest.mark.parametrize(
+    "tx",
+    # PLACE_ORDERS and CANCEL_AND_PLACE are signed as their individual txs
+    [
+        tx
+        for tx in NadoTxType
+        if tx not in (NadoTxType.PLACE_ORDERS, NadoTxType.CANCEL_AND_PLACE)
+    ],
+)
+def test_hash_eip712_message_matches_eth_account(
+    tx: NadoTxType,  # type: ignore
+    endpoint_addr: str,
+    chain_id: int,
+):
+    ((_, fields),) = get_nado_eip712_type(tx).items()
+    msg = {field["name"]: _EIP712_SAMPLE_VALUES[field["type"]] for field in fields}
+    eip712_typed_data = build_eip712_typed_data(tx, msg, endpoint_addr, chain_id)
 
-    for tx, verifying_contract, msg in to_sign:
-        eip712_typed_data = build_eip712_typed_data(
-            tx, msg, verifying_contract, chain_id
-        )
-        # raises an exception if signing fails
-        sign_eip712_typed_data(eip712_typed_data, signer)
-        get_eip712_typed_data_digest(eip712_typed_data)
+    signable = encode_typed_data(full_message=eip712_typed_data.dict())
+    assert _hash_eip712_message(eip712_typed_data) == signable.body
@@ -1,6 +1,8 @@
 from unittest.mock import MagicMock
 
 from nado_protocol.contracts import NadoContracts, NadoContractsContext
+from nado_protocol.contracts.loader import load_abi
+from nado_protocol.contracts.types import NadoAbiName
 
 
 def test_nado_contracts(
@@ -16,3 +18,10 @@ def test_nado_contracts(
     assert not contracts.clearinghouse
     assert not contracts.perp_engine
     assert not contracts.spot_engine
+
+
+def test_load_abi_cached():
+    abi = load_abi(NadoAbiName.ENDPOINT)
+
+    assert isinstance(abi, list)
+    assert load_abi(NadoAbiName.ENDPOINT) is abi
@@ -1,5 +1,6 @@
 from eth_account import Account
 from nado_protocol.engine_client import EngineClient, EngineClientOpts
+from nado_protocol.utils.backend import create_session
 from eth_account.signers.local import LocalAccount
 from pydantic import ValidationError
 import pytest
@@ -97,3 +98,13 @@ def test_create_client_all_opts(
         == client_from_opts.endpoint_addr
         == endpoint_addr
     )
+
+
+def test_create_client_session(url: str):
+    client = EngineClient({"url": url})
+    assert client.session is client._querier.session
+
+    session = create_session()
+    client_with_session = EngineClient(EngineClientOpts(url=url, session=session))
+    assert client_with_session.session is session
+    assert client_with_session._querier.session is session
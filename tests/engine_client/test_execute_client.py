@@ -1,5 +1,8 @@
 from eth_account import Account
 from nado_protocol.engine_client import EngineClient
+from nado_protocol.engine_client.types.execute import OrderParams
+from nado_protocol.utils.bytes32 import subaccount_to_bytes32
+from nado_protocol.utils.subaccount import SubaccountParams
 import pytest
 
 
@@ -50,3 +53,26 @@ def test_execute_client_properties(
     engine_client.linked_signer = None
 
     assert engine_client.linked_signer == engine_client.signer
+
+
+def test_prepare_execute_params_leaves_params_untouched(
+    engine_client: EngineClient,
+):
+    params = OrderParams(
+        sender=SubaccountParams(subaccount_name="default"),
+        priceX18=1000,
+        amount=1,
+        expiration=1000,
+        appendix=0,
+    )
+
+    prepared = engine_client.prepare_execute_params(params, True)
+
+    assert prepared.sender == subaccount_to_bytes32(
+        SubaccountParams(
+            subaccount_owner=engine_client.signer.address, subaccount_name="default"
+        )
+    )
+    assert prepared.nonce is not None
+    assert params.sender == SubaccountParams(subaccount_name="default")
+    assert params.nonce is None
@@ -1,3 +1,4 @@
+import pytest
 from nado_protocol.utils.expiration import (
     OrderType,
     get_expiration_timestamp,
@@ -9,16 +10,13 @@ from nado_protocol.utils.order import (
 )
 
 
-def test_simple_expiration():
+def test_simple_expiration(monkeypatch: pytest.MonkeyPatch):
     """Test that get_expiration_timestamp now returns timestamp + seconds."""
-    import time
-
-    seconds_from_now = 40
-    before = int(time.time())
-    result = get_expiration_timestamp(seconds_from_now)
-    after = int(time.time())
-    # Should be approximately current time + seconds_from_now
-    assert before + seconds_from_now <= result <= after + seconds_from_now + 1
+    monkeypatch.setattr(
+        "nado_protocol.utils.expiration.time.time", lambda: 1_700_000_000.5
+    )
+
+    assert get_expiration_timestamp(40) == 1_700_000_040
 
 
 def test_order_types_via_appendix():
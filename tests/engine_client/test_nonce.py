@@ -7,3 +7,6 @@ def test_nonce():
     time_now = int(time.time()) * 1000
 
     assert (nonce >> 20) >= time_now and (nonce >> 20) <= time_now + 99 * 1000
+
+    assert gen_order_nonce(1_700_000_000_000, 5) == (1_700_000_000_000 << 20) + 5
+    assert 0 <= gen_order_nonce(1_700_000_000_000) - (1_700_000_000_000 << 20) <= 999
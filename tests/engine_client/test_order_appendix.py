@@ -71,38 +71,40 @@ def test_isolated_position_functionality():
     assert order_isolated_margin(appendix) is None
 
 
-def test_twap_functionality():
-    """Test TWAP order appendix functionality."""
-    # Test various TWAP configurations
-    twap_configs = [
+@pytest.mark.parametrize(
+    "trigger_type",
+    [OrderAppendixTriggerType.TWAP, OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS],
+)
+@pytest.mark.parametrize(
+    "times, slippage_frac",
+    [
         (5, 0.01),  # 5 orders, 1% slippage
         (10, 0.005),  # 10 orders, 0.5% slippage
         (100, 0.001),  # 100 orders, 0.1% slippage
         (1, 0.1),  # 1 order, 10% slippage
-    ]
+    ],
+)
+def test_twap_functionality(
+    trigger_type: OrderAppendixTriggerType, times: int, slippage_frac: float
+):
+    """Test TWAP order appendix functionality."""
+    appendix = build_appendix(
+        OrderType.DEFAULT,
+        trigger_type=trigger_type,
+        twap_times=times,
+        twap_slippage_frac=slippage_frac,
+    )
 
-    for trigger_type in [
-        OrderAppendixTriggerType.TWAP,
-        OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS,
-    ]:
-        for times, slippage_frac in twap_configs:
-            appendix = build_appendix(
-                OrderType.DEFAULT,
-                trigger_type=trigger_type,
-                twap_times=times,
-                twap_slippage_frac=slippage_frac,
-            )
-
-            assert order_is_trigger_order(appendix)
-            assert order_trigger_type(appendix) == trigger_type
-
-            twap_data = order_twap_data(appendix)
-            assert twap_data is not None
-            extracted_orders, extracted_slippage = twap_data
-            assert extracted_orders == times
-            assert (
-                abs(extracted_slippage - slippage_frac) < 1e-6
-            )  # Allow for floating point precision
+    assert order_is_trigger_order(appendix)
+    assert order_trigger_type(appendix) == trigger_type
+
+    twap_data = order_twap_data(appendix)
+    assert twap_data is not None
+    extracted_orders, extracted_slippage = twap_data
+    assert extracted_orders == times
+    assert (
+        abs(extracted_slippage - slippage_frac) < 1e-6
+    )  # Allow for floating point precision
 
 
 def test_trigger_order_functionality():
@@ -149,10 +151,9 @@ def test_validation_and_edge_cases():
         build_appendix(OrderType.DEFAULT, isolated=False, isolated_margin=to_x6(10))
 
 
-def test_round_trip_conversions():
-    """Test that all appendix values can be built and decoded correctly."""
-    # Test various combinations
-    test_cases = [
+@pytest.mark.parametrize(
+    "case",
+    [
         # Basic cases - need to add order_type parameter
         {"order_type": OrderType.DEFAULT},
         {"order_type": OrderType.IOC, "reduce_only": True},
@@ -188,47 +189,47 @@ def test_round_trip_conversions():
             "isolated_margin": to_x6(10),
             "reduce_only": True,
         },
-    ]
-
-    for case in test_cases:
-        # Build appendix - extract order_type as first positional parameter
-        order_type = case.pop("order_type", OrderType.DEFAULT)
-        appendix = build_appendix(order_type, **case)
-
-        # Extract values
-        extracted = {
-            "version": order_version(appendix),
-            "order_type": order_execution_type(appendix),
-            "reduce_only": order_reduce_only(appendix),
-            "is_isolated": order_is_isolated(appendix),
-            "isolated_margin": order_isolated_margin(appendix),
-            "is_trigger": order_is_trigger_order(appendix),
-            "trigger_type": order_trigger_type(appendix),
-            "twap_data": order_twap_data(appendix),
-        }
-
-        # Verify key values match
-        assert extracted["version"] == APPENDIX_VERSION
-
-        if "order_type" in case:
-            assert extracted["order_type"] == case["order_type"]
-
-        if "reduce_only" in case:
-            assert extracted["reduce_only"] == case["reduce_only"]
-
-        if case.get("isolated"):
-            assert extracted["is_isolated"]
-            assert extracted["isolated_margin"] == case["isolated_margin"]
-
-        if "trigger_type" in case:
-            assert extracted["is_trigger"]
-            assert extracted["trigger_type"] == case["trigger_type"]
-
-            if case["trigger_type"] in [
-                OrderAppendixTriggerType.TWAP,
-                OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS,
-            ]:
-                assert extracted["twap_data"] is not None
-                orders, slippage = extracted["twap_data"]
-                assert orders == case["twap_times"]
-                assert abs(slippage - case["twap_slippage_frac"]) < 1e-6
+    ],
+)
+def test_round_trip_conversions(case: dict):
+    """Test that all appendix values can be built and decoded correctly."""
+    # Build appendix - extract order_type as first positional parameter
+    case = dict(case)
+    order_type = case.pop("order_type", OrderType.DEFAULT)
+    appendix = build_appendix(order_type, **case)
+
+    # Extract values
+    extracted = {
+        "version": order_version(appendix),
+        "order_type": order_execution_type(appendix),
+        "reduce_only": order_reduce_only(appendix),
+        "is_isolated": order_is_isolated(appendix),
+        "isolated_margin": order_isolated_margin(appendix),
+        "is_trigger": order_is_trigger_order(appendix),
+        "trigger_type": order_trigger_type(appendix),
+        "twap_data": order_twap_data(appendix),
+    }
+
+    # Verify key values match
+    assert extracted["version"] == APPENDIX_VERSION
+    assert extracted["order_type"] == order_type
+
+    if "reduce_only" in case:
+        assert extracted["reduce_only"] == case["reduce_only"]
+
+    if case.get("isolated"):
+        assert extracted["is_isolated"]
+        assert extracted["isolated_margin"] == case["isolated_margin"]
+
+    if "trigger_type" in case:
+        assert extracted["is_trigger"]
+        assert extracted["trigger_type"] == case["trigger_type"]
+
+        if case["trigger_type"] in [
+            OrderAppendixTriggerType.TWAP,
+            OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS,
+        ]:
+            assert extracted["twap_data"] is not None
+            orders, slippage = extracted["twap_data"]
+            assert orders == case["twap_times"]
+            assert abs(slippage - case["twap_slippage_frac"]) < 1e-6
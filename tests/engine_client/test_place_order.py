@@ -1,7 +1,7 @@
 import json
+from typing import Callable
 from unittest.mock import MagicMock
 
-from eth_account import Account
 from eth_account.signers.local import LocalAccount
 from nado_protocol.contracts.eip712.sign import (
     build_eip712_typed_data,
@@ -34,6 +34,11 @@ from nado_protocol.utils.subaccount import SubaccountParams
 from nado_protocol.utils.expiration import OrderType
 from nado_protocol.utils.math import to_x18
 
+# Order fields shared by the appendix tests, which only vary the appendix
+PRICE_X18 = 28898000000000000000000
+AMOUNT = 10000000000000000
+EXPIRATION = 4611687701117784255
+
 
 def test_place_order_params(senders: list[str], owners: list[str], order_params: dict):
     product_id = 1
@@ -143,9 +148,10 @@ def test_place_order_execute_fails_incomplete_client(
     mock_post: MagicMock,
     url: str,
     chain_id: int,
-    private_keys: list[str],
+    signer: LocalAccount,
     senders: list[str],
     order_params: dict,
+    ok_response: Callable[[dict], MagicMock],
 ):
     engine_client = EngineClient({"url": url})
     place_order_params = {
@@ -161,15 +167,9 @@ def test_place_order_execute_fails_incomplete_client(
     with pytest.raises(AttributeError, match="Signer is not set."):
         engine_client.place_order(place_order_params)
 
-    engine_client.signer = Account.from_key(private_keys[0])
+    engine_client.signer = signer
 
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": "xxx",
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response({"status": "success", "signature": "xxx"})
 
     res = engine_client.place_order(place_order_params)
     place_order_req = PlaceOrderRequest(**res.req)
@@ -178,7 +178,10 @@ def test_place_order_execute_fails_incomplete_client(
 
 
 def test_place_order_execute_success(
-    engine_client: EngineClient, mock_post: MagicMock, senders: list[str]
+    engine_client: EngineClient,
+    mock_post: MagicMock,
+    senders: list[str],
+    ok_response: Callable[[dict], MagicMock],
 ):
     product_id = 1
     place_order_params = PlaceOrderParams(
@@ -193,25 +196,27 @@ def test_place_order_execute_success(
         ),
     )
 
-    order = place_order_params.order.copy(deep=True)
+    order = place_order_params.order.model_copy(
+        update={"sender": hex_to_bytes32(senders[0])}
+    )
     order_digest = "0x123"
-    order.sender = hex_to_bytes32(senders[0])
+    order_dict = order.dict()
 
     with pytest.raises(
         ValueError,
         match="Missing `product_id` to sign place_order execute",
     ):
-        engine_client._sign(NadoExecuteType.PLACE_ORDER, order.dict())
+        engine_client._sign(NadoExecuteType.PLACE_ORDER, order_dict)
 
     expected_signature = engine_client._sign(
         NadoExecuteType.PLACE_ORDER,
-        order.dict(),
+        order_dict,
         product_id=place_order_params.product_id,
     )
     computed_signature = sign_eip712_typed_data(
         typed_data=build_eip712_typed_data(
             NadoExecuteType.PLACE_ORDER,
-            order.dict(),
+            order_dict,
             gen_order_verifying_contract(1),
             engine_client.chain_id,
         ),
@@ -220,13 +225,13 @@ def test_place_order_execute_success(
 
     assert expected_signature == computed_signature
 
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": expected_signature,
-        "data": {"digest": order_digest},
-    }
+    mock_response = ok_response(
+        {
+            "status": "success",
+            "signature": expected_signature,
+            "data": {"digest": order_digest},
+        }
+    )
     mock_post.return_value = mock_response
 
     res = engine_client.place_order(place_order_params)
@@ -256,20 +261,16 @@ def test_place_order_execute_success(
     expected_signature = sign_eip712_typed_data(
         typed_data=build_eip712_typed_data(
             NadoExecuteType.PLACE_ORDER,
-            order.dict(),
+            order_dict,
             gen_order_verifying_contract(1),
             engine_client.chain_id,
         ),
         signer=engine_client._opts.signer,
     )
 
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": expected_signature,
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response(
+        {"status": "success", "signature": expected_signature}
+    )
 
     res = engine_client.place_order(place_order_params)
     place_order_req = PlaceOrderRequest(**res.req)
@@ -278,18 +279,15 @@ def test_place_order_execute_success(
 
 
 def test_place_order_execute_provide_full_params(
-    mock_post: MagicMock, url: str, chain_id: int, private_keys: list[str]
+    mock_post: MagicMock,
+    url: str,
+    chain_id: int,
+    signer: LocalAccount,
+    ok_response: Callable[[dict], MagicMock],
 ):
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": "xxx",
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response({"status": "success", "signature": "xxx"})
 
     engine_client = EngineClient({"url": url})
-    signer: LocalAccount = Account.from_key(private_keys[0])
     sender = subaccount_to_bytes32(signer.address, "default")
     product_id = 1
     order_params = {
@@ -321,21 +319,24 @@ def test_place_order_execute_provide_full_params(
     assert req.place_order.order.expiration == str(order_params["expiration"])
     assert req.place_order.order.appendix == str(order_params["appendix"])
 
+    # The posted body is the JSON encoding of the request
+    assert json.loads(mock_post.call_args.kwargs["data"]) == res.req
+    assert mock_post.call_args.kwargs["headers"]["Content-Type"] == "application/json"
+
 
-def test_place_order_with_basic_appendix(senders: list[str], owners: list[str]):
+def test_place_order_with_basic_appendix(sender_b32: bytes, owners: list[str]):
     """Test placing order with basic appendix functionality."""
     product_id = 1
-    sender = hex_to_bytes32(senders[0])
 
     # Test with IOC order type
     ioc_appendix = build_appendix(OrderType.IOC)
     params = PlaceOrderParams(
         product_id=product_id,
         order=OrderParams(
-            sender=sender,
-            priceX18=28898000000000000000000,
-            amount=-10000000000000000,
-            expiration=4611687701117784255,
+            sender=sender_b32,
+            priceX18=PRICE_X18,
+            amount=-AMOUNT,
+            expiration=EXPIRATION,
             appendix=ioc_appendix,
         ),
     )
@@ -347,10 +348,10 @@ def test_place_order_with_basic_appendix(senders: list[str], owners: list[str]):
     params_reduce = PlaceOrderParams(
         product_id=product_id,
         order=OrderParams(
-            sender=sender,
-            priceX18=28898000000000000000000,
-            amount=-10000000000000000,
-            expiration=4611687701117784255,
+            sender=sender_b32,
+            priceX18=PRICE_X18,
+            amount=-AMOUNT,
+            expiration=EXPIRATION,
             appendix=reduce_only_appendix,
         ),
     )
@@ -358,10 +359,9 @@ def test_place_order_with_basic_appendix(senders: list[str], owners: list[str]):
     assert params_reduce.order.appendix == reduce_only_appendix
 
 
-def test_place_order_with_isolated_position_appendix(senders: list[str]):
+def test_place_order_with_isolated_position_appendix(sender_b32: bytes):
     """Test placing order with isolated position appendix."""
     product_id = 1
-    sender = hex_to_bytes32(senders[0])
     margin = 1000000  # 1M units margin
 
     isolated_appendix = build_appendix(
@@ -371,10 +371,10 @@ def test_place_order_with_isolated_position_appendix(senders: list[str]):
     params = PlaceOrderParams(
         product_id=product_id,
         order=OrderParams(
-            sender=sender,
-            priceX18=28898000000000000000000,
-            amount=10000000000000000,  # Long position
-            expiration=4611687701117784255,
+            sender=sender_b32,
+            priceX18=PRICE_X18,
+            amount=AMOUNT,  # Long position
+            expiration=EXPIRATION,
             appendix=isolated_appendix,
         ),
     )
@@ -382,10 +382,9 @@ def test_place_order_with_isolated_position_appendix(senders: list[str]):
     assert params.order.appendix == isolated_appendix
 
 
-def test_place_order_with_twap_appendix(senders: list[str]):
+def test_place_order_with_twap_appendix(sender_b32: bytes):
     """Test placing order with TWAP appendix."""
     product_id = 1
-    sender = hex_to_bytes32(senders[0])
 
     # Test regular TWAP
     twap_appendix = build_appendix(
@@ -398,10 +397,10 @@ def test_place_order_with_twap_appendix(senders: list[str]):
     params = PlaceOrderParams(
         product_id=product_id,
         order=OrderParams(
-            sender=sender,
-            priceX18=28898000000000000000000,
-            amount=10000000000000000,
-            expiration=4611687701117784255,
+            sender=sender_b32,
+            priceX18=PRICE_X18,
+            amount=AMOUNT,
+            expiration=EXPIRATION,
             appendix=twap_appendix,
         ),
     )
@@ -420,10 +419,10 @@ def test_place_order_with_twap_appendix(senders: list[str]):
     params_custom = PlaceOrderParams(
         product_id=product_id,
         order=OrderParams(
-            sender=sender,
-            priceX18=28898000000000000000000,
-            amount=-10000000000000000,  # Close position
-            expiration=4611687701117784255,
+            sender=sender_b32,
+            priceX18=PRICE_X18,
+            amount=-AMOUNT,  # Close position
+            expiration=EXPIRATION,
             appendix=twap_custom_appendix,
         ),
     )
@@ -431,10 +430,9 @@ def test_place_order_with_twap_appendix(senders: list[str]):
     assert params_custom.order.appendix == twap_custom_appendix
 
 
-def test_place_order_with_price_trigger_appendix(senders: list[str]):
+def test_place_order_with_price_trigger_appendix(sender_b32: bytes):
     """Test placing order with price trigger appendix."""
     product_id = 1
-    sender = hex_to_bytes32(senders[0])
 
     trigger_appendix = build_appendix(
         OrderType.IOC, reduce_only=True, trigger_type=OrderAppendixTriggerType.PRICE
@@ -443,10 +441,10 @@ def test_place_order_with_price_trigger_appendix(senders: list[str]):
     params = PlaceOrderParams(
         product_id=product_id,
         order=OrderParams(
-            sender=sender,
-            priceX18=28898000000000000000000,
+            sender=sender_b32,
+            priceX18=PRICE_X18,
             amount=-5000000000000000,  # Partial close
-            expiration=4611687701117784255,
+            expiration=EXPIRATION,
             appendix=trigger_appendix,
         ),
     )
@@ -454,45 +452,42 @@ def test_place_order_with_price_trigger_appendix(senders: list[str]):
     assert params.order.appendix == trigger_appendix
 
 
-def test_place_order_appendix_combinations(senders: list[str]):
+@pytest.mark.parametrize(
+    "order_type, appendix_kwargs, amount",
+    [
+        # All order types with reduce-only
+        (OrderType.DEFAULT, {"reduce_only": True}, -AMOUNT),
+        (OrderType.IOC, {"reduce_only": True}, -AMOUNT),
+        (OrderType.FOK, {"reduce_only": True}, -AMOUNT),
+        (OrderType.POST_ONLY, {"reduce_only": True}, -AMOUNT),
+        # Isolated position with different order types
+        (
+            OrderType.DEFAULT,
+            {"isolated": True, "isolated_margin": to_x18(500000)},
+            AMOUNT,
+        ),
+        (
+            OrderType.POST_ONLY,
+            {"isolated": True, "isolated_margin": to_x18(500000)},
+            AMOUNT,
+        ),
+    ],
+)
+def test_place_order_appendix_combinations(
+    sender_b32: bytes, order_type: OrderType, appendix_kwargs: dict, amount: int
+):
     """Test various valid appendix combinations."""
-    product_id = 1
-    sender = hex_to_bytes32(senders[0])
-
-    # Test all order types with reduce-only
-    order_types = [OrderType.DEFAULT, OrderType.IOC, OrderType.FOK, OrderType.POST_ONLY]
+    appendix = build_appendix(order_type, **appendix_kwargs)
 
-    for order_type in order_types:
-        appendix = build_appendix(order_type, reduce_only=True)
-
-        params = PlaceOrderParams(
-            product_id=product_id,
-            order=OrderParams(
-                sender=sender,
-                priceX18=28898000000000000000000,
-                amount=-10000000000000000,
-                expiration=4611687701117784255,
-                appendix=appendix,
-            ),
-        )
-
-        assert params.order.appendix == appendix
-
-    # Test isolated position with different order types
-    for order_type in [OrderType.DEFAULT, OrderType.POST_ONLY]:
-        isolated_appendix = build_appendix(
-            order_type, isolated=True, isolated_margin=to_x18(500000)
-        )
-
-        params = PlaceOrderParams(
-            product_id=product_id,
-            order=OrderParams(
-                sender=sender,
-                priceX18=28898000000000000000000,
-                amount=10000000000000000,
-                expiration=4611687701117784255,
-                appendix=isolated_appendix,
-            ),
-        )
+    params = PlaceOrderParams(
+        product_id=1,
+        order=OrderParams(
+            sender=sender_b32,
+            priceX18=PRICE_X18,
+            amount=amount,
+            expiration=EXPIRATION,
+            appendix=appendix,
+        ),
+    )
 
-        assert params.order.appendix == isolated_appendix
+    assert params.order.appendix == appendix
@@ -1,5 +1,8 @@
+from typing import Callable
 from unittest.mock import MagicMock
 
+import pytest
+
 from nado_protocol.indexer_client import IndexerClient
 from nado_protocol.indexer_client.types.query import (
     IndexerCandlesticksParams,
@@ -19,154 +22,139 @@ from nado_protocol.indexer_client.types.query import (
     IndexerBaseParams,
 )
 
-
-def test_indexer_obj_query_params(
-    mock_post: MagicMock,
-    url: str,
-):
-    indexer_client = IndexerClient({"url": url})
-
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"orders": []}
-    mock_post.return_value = mock_response
-
-    indexer_client.get_subaccount_historical_orders(
-        IndexerSubaccountHistoricalOrdersParams(subaccounts=["xxx"])
-    )
-    indexer_client.get_historical_orders_by_digest([])
-
-    mock_response.json.return_value = {"matches": [], "txs": []}
-    mock_post.return_value = mock_response
-    indexer_client.get_matches(IndexerMatchesParams(subaccounts=["xxx"]))
-
-    mock_response.json.return_value = {"events": [], "txs": []}
-    mock_post.return_value = mock_response
-    indexer_client.get_events(IndexerEventsParams(submission_idx=10))
-
-    mock_response.json.return_value = {"products": [], "txs": []}
-    mock_post.return_value = mock_response
-    indexer_client.get_product_snapshots(IndexerProductSnapshotsParams(product_id=1))
-
-    mock_response.json.return_value = {"candlesticks": []}
-    mock_post.return_value = mock_response
-    indexer_client.get_candlesticks(
-        IndexerCandlesticksParams(granularity=60, product_id=1)
-    )
-
-    mock_response.json.return_value = {
+# Canned indexer responses, keyed by the top-level key of the query payload
+INDEXER_RESPONSES = {
+    "orders": {"orders": []},
+    "matches": {"matches": [], "txs": []},
+    "events": {"events": [], "txs": []},
+    "products": {"products": [], "txs": []},
+    "candlesticks": {"candlesticks": []},
+    "funding_rate": {
         "product_id": 1,
         "funding_rate_x18": "0",
         "update_time": "0",
-    }
-    mock_post.return_value = mock_response
-    indexer_client.get_perp_funding_rate(product_id=1)
-
-    mock_response.json.return_value = {
+    },
+    "price": {
         "product_id": 1,
         "index_price_x18": "0",
         "mark_price_x18": "0",
         "update_time": "0",
-    }
-    mock_post.return_value = mock_response
-    indexer_client.get_perp_prices(product_id=1)
-
-    mock_response.json.return_value = {"prices": []}
-    mock_post.return_value = mock_response
-    indexer_client.get_oracle_prices([])
-
-    mock_response.json.return_value = []
-    mock_post.return_value = mock_response
-    indexer_client.get_liquidation_feed()
-
-    mock_response.json.return_value = {
+    },
+    "oracle_price": {"prices": []},
+    "liquidation_feed": [],
+    "linked_signer_rate_limit": {
         "remaining_tx": "0",
         "total_tx_limit": "0",
         "wait_time": 0,
         "signer": "xxx",
-    }
-    mock_post.return_value = mock_response
-    indexer_client.get_linked_signer_rate_limits("xxx")
-
+    },
+}
 
-def test_indexer_raw_query_params(
-    mock_post: MagicMock,
-    url: str,
-):
-    indexer_client = IndexerClient({"url": url})
-
-    mock_response = MagicMock()
-    mock_response.status_code = 200
 
-    mock_response.json.return_value = {"orders": []}
-    mock_post.return_value = mock_response
-    indexer_client.get_subaccount_historical_orders({"subaccounts": ["xxx"]})
+@pytest.fixture(scope="module")
+def indexer_client(url: str) -> IndexerClient:
+    # `mock_post` patches `requests.Session.post` per test, so one client is enough
+    return IndexerClient({"url": url})
 
-    mock_response.json.return_value = {"matches": [], "txs": []}
-    mock_post.return_value = mock_response
-    indexer_client.get_matches({"subaccounts": ["xxx"]})
 
-    mock_response.json.return_value = {"events": [], "txs": []}
-    mock_post.return_value = mock_response
-    indexer_client.get_events({"submission_idx": 10})
+@pytest.fixture(scope="module")
+def indexer_responses() -> dict[str, MagicMock]:
+    # Built once per module; the client only reads the canned payloads
+    return {
+        query: MagicMock(status_code=200, **{"json.return_value": payload})
+        for query, payload in INDEXER_RESPONSES.items()
+    }
 
-    mock_response.json.return_value = {"products": [], "txs": []}
-    mock_post.return_value = mock_response
-    indexer_client.get_product_snapshots({"product_id": 1})
 
-    mock_response.json.return_value = {"candlesticks": []}
-    mock_post.return_value = mock_response
-    indexer_client.get_candlesticks({"granularity": 60, "product_id": 1})
+@pytest.fixture
+def mock_indexer_post(
+    mock_post: MagicMock, indexer_responses: dict[str, MagicMock]
+) -> MagicMock:
+    mock_post.side_effect = lambda url, json, **kwargs: indexer_responses[
+        next(iter(json))
+    ]
+    return mock_post
 
 
+# Client queries built from param models and from the equivalent raw dicts
+OBJ_PARAM_QUERIES: list[Callable[[IndexerClient], object]] = [
+    lambda client: client.get_subaccount_historical_orders(
+        IndexerSubaccountHistoricalOrdersParams(subaccounts=["xxx"])
+    ),
+    lambda client: client.get_historical_orders_by_digest([]),
+    lambda client: client.get_matches(IndexerMatchesParams(subaccounts=["xxx"])),
+    lambda client: client.get_events(IndexerEventsParams(submission_idx=10)),
+    lambda client: client.get_product_snapshots(
+        IndexerProductSnapshotsParams(product_id=1)
+    ),
+    lambda client: client.get_candlesticks(
+        IndexerCandlesticksParams(granularity=60, product_id=1)
+    ),
+    lambda client: client.get_perp_funding_rate(product_id=1),
+    lambda client: client.get_perp_prices(product_id=1),
+    lambda client: client.get_oracle_prices([]),
+    lambda client: client.get_liquidation_feed(),
+    lambda client: client.get_linked_signer_rate_limits("xxx"),
+]
+
+RAW_PARAM_QUERIES: list[Callable[[IndexerClient], object]] = [
+    lambda client: client.get_subaccount_historical_orders({"subaccounts": ["xxx"]}),
+    lambda client: client.get_matches({"subaccounts": ["xxx"]}),
+    lambda client: client.get_events({"submission_idx": 10}),
+    lambda client: client.get_product_snapshots({"product_id": 1}),
+    lambda client: client.get_candlesticks({"granularity": 60, "product_id": 1}),
+]
+
+
+@pytest.mark.parametrize("query", OBJ_PARAM_QUERIES + RAW_PARAM_QUERIES)
+def test_indexer_query_params(
+    mock_indexer_post: MagicMock,
+    indexer_client: IndexerClient,
+    query: Callable[[IndexerClient], object],
+):
+    query(indexer_client)
+
+    mock_indexer_post.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "req",
+    [
+        {"orders": {"subaccounts": ["xxx"]}},
+        IndexerHistoricalOrdersRequest(orders={"subaccounts": ["xxx"]}),
+        {"matches": {"subaccounts": ["xxx"]}},
+        IndexerMatchesRequest(matches={"subaccounts": ["xxx"]}),
+        {"events": {"subaccounts": ["xxx"]}},
+        IndexerEventsParams(events={"subaccounts": ["xxx"]}),
+        {"products": {"product_id": 1}},
+        IndexerProductSnapshotsRequest(products={"product_id": 1}),
+        {"candlesticks": {"granularity": 300, "product_id": 1}},
+        IndexerCandlesticksRequest(candlesticks={"granularity": 300, "product_id": 1}),
+        {"funding_rate": {"product_id": 1}},
+        IndexerFundingRateRequest(funding_rate={"product_id": 1}),
+        {"price": {"product_id": 1}},
+        IndexerPerpPricesRequest(price={"product_id": 1}),
+        {"oracle_price": {"product_ids": [1]}},
+        IndexerOraclePricesRequest(oracle_price={"product_ids": [1]}),
+        {"liquidation_feed": {}},
+        IndexerLiquidationFeedRequest(liquidation_feed={}),
+        {"linked_signer_rate_limit": {"subaccount": "xxx"}},
+        IndexerLinkedSignerRateLimitRequest(
+            linked_signer_rate_limit={"subaccount": "xxx"}
+        ),
+    ],
+)
 def test_indexer_request_params(
     mock_post: MagicMock,
-    url: str,
+    indexer_client: IndexerClient,
+    ok_response: Callable[[dict], MagicMock],
+    req,
 ):
-    indexer_client = IndexerClient({"url": url})
-
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = []
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response([])
 
-    indexer_client.query({"orders": {"subaccounts": ["xxx"]}})
-    indexer_client.query(
-        IndexerHistoricalOrdersRequest(orders={"subaccounts": ["xxx"]})
-    )
+    indexer_client.query(req)
 
-    indexer_client.query({"matches": {"subaccounts": ["xxx"]}})
-    indexer_client.query(IndexerMatchesRequest(matches={"subaccounts": ["xxx"]}))
-
-    indexer_client.query({"events": {"subaccounts": ["xxx"]}})
-    indexer_client.query(IndexerEventsParams(events={"subaccounts": ["xxx"]}))
-
-    indexer_client.query({"products": {"product_id": 1}})
-    indexer_client.query(IndexerProductSnapshotsRequest(products={"product_id": 1}))
-
-    indexer_client.query({"candlesticks": {"granularity": 300, "product_id": 1}})
-    indexer_client.query(
-        IndexerCandlesticksRequest(candlesticks={"granularity": 300, "product_id": 1})
-    )
-
-    indexer_client.query({"funding_rate": {"product_id": 1}})
-    indexer_client.query(IndexerFundingRateRequest(funding_rate={"product_id": 1}))
-
-    indexer_client.query({"price": {"product_id": 1}})
-    indexer_client.query(IndexerPerpPricesRequest(price={"product_id": 1}))
-
-    indexer_client.query({"oracle_price": {"product_ids": [1]}})
-    indexer_client.query(IndexerOraclePricesRequest(oracle_price={"product_ids": [1]}))
-
-    indexer_client.query({"liquidation_feed": {}})
-    indexer_client.query(IndexerLiquidationFeedRequest(liquidation_feed={}))
-
-    indexer_client.query({"linked_signer_rate_limit": {"subaccount": "xxx"}})
-    indexer_client.query(
-        IndexerLinkedSignerRateLimitRequest(
-            linked_signer_rate_limit={"subaccount": "xxx"}
-        )
-    )
+    mock_post.assert_called_once()
 
 
 def test_indexer_base_params():
@@ -57,13 +57,17 @@ def test_create_nado_client_context(
         == full_engine_client_setup.indexer_client.url
         == url
     )
+    assert (
+        full_engine_client_setup.engine_client.session
+        is full_engine_client_setup.engine_client._querier.session
+        is full_engine_client_setup.indexer_client.session
+    )
 
     mock_response.status_code = 400
     mock_response.json.return_value = {
         "status": "failure",
         "data": "invalid request",
     }
-    mock_post.return_value = mock_response
 
     partial_engine_client_setup = create_nado_client_context(
         NadoClientContextOpts(
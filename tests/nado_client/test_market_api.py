@@ -10,18 +10,18 @@ from nado_protocol.engine_client.types.execute import (
     OrderParams,
     PlaceOrderParams,
 )
-from nado_protocol.utils.bytes32 import subaccount_to_bytes32
 
 
 def test_mint_nlp(
     nado_client: NadoClient,
     senders: list[str],
+    sender_b32: bytes,
     mock_tx_nonce: MagicMock,
     mock_execute_response: MagicMock,
 ):
     params = MintNlpParams(sender=senders[0], quoteAmount=10)
     res = nado_client.market.mint_nlp(params)
-    params.sender = subaccount_to_bytes32(senders[0])
+    params.sender = sender_b32
     params.nonce = 1
     signature = nado_client.context.engine_client.sign(
         NadoExecuteType.MINT_NLP,
@@ -45,12 +45,13 @@ def test_mint_nlp(
 def test_burn_nlp(
     nado_client: NadoClient,
     senders: list[str],
+    sender_b32: bytes,
     mock_execute_response: MagicMock,
     mock_tx_nonce: MagicMock,
 ):
     params = BurnNlpParams(sender=senders[0], productId=1, nlpAmount=10)
     res = nado_client.market.burn_nlp(params)
-    params.sender = subaccount_to_bytes32(senders[0])
+    params.sender = sender_b32
     params.nonce = 1
     signature = nado_client.context.engine_client.sign(
         NadoExecuteType.BURN_NLP,
@@ -74,6 +75,7 @@ def test_burn_nlp(
 def test_place_order(
     nado_client: NadoClient,
     senders: list[str],
+    sender_b32: bytes,
     mock_place_order_response: MagicMock,
     mock_tx_nonce: MagicMock,
 ):
@@ -82,7 +84,7 @@ def test_place_order(
     )
     params = PlaceOrderParams(product_id=1, order=order)
     res = nado_client.market.place_order(params)
-    order.sender = subaccount_to_bytes32(senders[0])
+    order.sender = sender_b32
     signature = nado_client.context.engine_client.sign(
         NadoExecuteType.PLACE_ORDER,
         order.dict(),
@@ -96,11 +98,11 @@ def test_place_order(
             "product_id": 1,
             "order": {
                 "sender": senders[0].lower(),
-                "priceX18": str(1000),
-                "amount": str(1),
-                "expiration": str(1),
-                "appendix": str(0),
-                "nonce": str(1),
+                "priceX18": "1000",
+                "amount": "1",
+                "expiration": "1",
+                "appendix": "0",
+                "nonce": "1",
             },
             "signature": signature,
         }
@@ -121,18 +123,10 @@ def test_cancel_orders(
         nonce=2,
     )
     res = nado_client.market.cancel_orders(params)
-    params.sender = subaccount_to_bytes32(senders[0])
-    nado_client.context.engine_client.sign(
-        NadoExecuteType.CANCEL_ORDERS,
-        params.dict(),
-        nado_client.context.engine_client.endpoint_addr,
-        nado_client.context.engine_client.chain_id,
-        nado_client.context.engine_client.signer,
-    )
     cancelled_order = res.data.cancelled_orders.pop()
     assert cancelled_order.product_id == 1
-    assert cancelled_order.amount == str(-10000000000000000)
-    assert cancelled_order.nonce == str(1)
+    assert cancelled_order.amount == "-10000000000000000"
+    assert cancelled_order.nonce == "1"
 
 
 def test_cancel_product_orders(
@@ -149,18 +143,10 @@ def test_cancel_product_orders(
     )
 
     res = nado_client.market.cancel_product_orders(params)
-    params.sender = subaccount_to_bytes32(senders[0])
-    nado_client.context.engine_client.sign(
-        NadoExecuteType.CANCEL_PRODUCT_ORDERS,
-        params.dict(),
-        nado_client.context.engine_client.endpoint_addr,
-        nado_client.context.engine_client.chain_id,
-        nado_client.context.engine_client.signer,
-    )
     cancelled_order = res.data.cancelled_orders.pop()
     assert cancelled_order.product_id == 1
-    assert cancelled_order.amount == str(-10000000000000000)
-    assert cancelled_order.nonce == str(1)
+    assert cancelled_order.amount == "-10000000000000000"
+    assert cancelled_order.nonce == "1"
 
 
 def test_place_twap_order(
@@ -1,6 +1,6 @@
+from typing import Callable
 from unittest.mock import MagicMock
 import json
-from eth_account import Account
 import pytest
 from nado_protocol.contracts.eip712.sign import (
     build_eip712_typed_data,
@@ -13,6 +13,7 @@ from nado_protocol.trigger_client import TriggerClient
 from nado_protocol.trigger_client.types.execute import (
     PlaceTriggerOrderParams,
     PlaceTriggerOrderRequest,
+    PlaceTriggerOrdersParams,
     to_trigger_execute_request,
 )
 from nado_protocol.trigger_client.types.models import (
@@ -201,9 +202,10 @@ def test_place_order_execute_fails_incomplete_client(
     mock_post: MagicMock,
     url: str,
     chain_id: int,
-    private_keys: list[str],
+    signer: LocalAccount,
     senders: list[str],
     order_params: dict,
+    ok_response: Callable[[dict], MagicMock],
 ):
     trigger_client = TriggerClient({"url": url})
     place_trigger_order_params = {
@@ -224,15 +226,9 @@ def test_place_order_execute_fails_incomplete_client(
     with pytest.raises(AttributeError, match="Signer is not set."):
         trigger_client.place_trigger_order(place_trigger_order_params)
 
-    trigger_client.signer = Account.from_key(private_keys[0])
+    trigger_client.signer = signer
 
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": "xxx",
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response({"status": "success", "signature": "xxx"})
 
     res = trigger_client.place_trigger_order(place_trigger_order_params)
     place_trigger_order_req = PlaceTriggerOrderRequest(**res.req)
@@ -243,7 +239,10 @@ def test_place_order_execute_fails_incomplete_client(
 
 
 def test_place_order_execute_success(
-    trigger_client: TriggerClient, mock_post: MagicMock, senders: list[str]
+    trigger_client: TriggerClient,
+    mock_post: MagicMock,
+    senders: list[str],
+    ok_response: Callable[[dict], MagicMock],
 ):
     product_id = 1
     place_trigger_order_params = PlaceTriggerOrderParams(
@@ -263,24 +262,26 @@ def test_place_order_execute_success(
         ),
     )
 
-    order = place_trigger_order_params.order.copy(deep=True)
-    order.sender = hex_to_bytes32(senders[0])
+    order = place_trigger_order_params.order.model_copy(
+        update={"sender": hex_to_bytes32(senders[0])}
+    )
+    order_dict = order.dict()
 
     with pytest.raises(
         ValueError,
         match="Missing `product_id` to sign place_order execute",
     ):
-        trigger_client._sign(NadoExecuteType.PLACE_ORDER, order.dict())
+        trigger_client._sign(NadoExecuteType.PLACE_ORDER, order_dict)
 
     expected_signature = trigger_client._sign(
         NadoExecuteType.PLACE_ORDER,
-        order.dict(),
+        order_dict,
         product_id=place_trigger_order_params.product_id,
     )
     computed_signature = sign_eip712_typed_data(
         typed_data=build_eip712_typed_data(
             NadoExecuteType.PLACE_ORDER,
-            order.dict(),
+            order_dict,
             gen_order_verifying_contract(product_id),
             trigger_client.chain_id,
         ),
@@ -289,13 +290,9 @@ def test_place_order_execute_success(
 
     assert expected_signature == computed_signature
 
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": expected_signature,
-        "data": None,
-    }
+    mock_response = ok_response(
+        {"status": "success", "signature": expected_signature, "data": None}
+    )
     mock_post.return_value = mock_response
 
     res = trigger_client.place_trigger_order(place_trigger_order_params)
@@ -331,20 +328,16 @@ def test_place_order_execute_success(
     expected_signature = sign_eip712_typed_data(
         typed_data=build_eip712_typed_data(
             NadoExecuteType.PLACE_ORDER,
-            order.dict(),
+            order_dict,
             gen_order_verifying_contract(product_id),
             trigger_client.chain_id,
         ),
         signer=trigger_client._opts.signer,
     )
 
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": expected_signature,
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response(
+        {"status": "success", "signature": expected_signature}
+    )
 
     res = trigger_client.place_trigger_order(place_trigger_order_params)
     place_trigger_order_req = PlaceTriggerOrderRequest(**res.req)
@@ -352,19 +345,76 @@ def test_place_order_execute_success(
     assert place_trigger_order_req.place_order.signature == expected_signature
 
 
+def test_place_trigger_orders_execute_success(
+    trigger_client: TriggerClient,
+    mock_post: MagicMock,
+    senders: list[str],
+    ok_response: Callable[[dict], MagicMock],
+):
+    product_ids = [1, 2]
+    orders = [
+        PlaceTriggerOrderParams(
+            product_id=product_id,
+            order=OrderParams(
+                sender=SubaccountParams(subaccount_name="default"),
+                priceX18=1000,
+                amount=1000,
+                expiration=1000,
+                nonce=1000 + product_id,
+                appendix=0,
+            ),
+            trigger=PriceTrigger(
+                price_trigger=PriceTriggerData(
+                    price_requirement=LastPriceAbove(last_price_above="100")
+                )
+            ),
+        )
+        for product_id in product_ids
+    ]
+    expected_signatures = [
+        trigger_client._sign(
+            NadoExecuteType.PLACE_ORDER,
+            order_params.order.model_copy(
+                update={"sender": hex_to_bytes32(senders[0])}
+            ).dict(),
+            product_id=order_params.product_id,
+        )
+        for order_params in orders
+    ]
+    mock_post.return_value = ok_response(
+        {
+            "status": "success",
+            "data": {"place_orders": [{"digest": "0x1"}, {"digest": "0x2"}]},
+        }
+    )
+
+    res = trigger_client.place_trigger_orders(
+        PlaceTriggerOrdersParams(orders=orders, stop_on_failure=True)
+    )
+
+    # every order is signed individually but submitted in a single request
+    mock_post.assert_called_once()
+    place_orders_req = json.loads(mock_post.call_args.kwargs["data"])["place_orders"]
+    assert place_orders_req["stop_on_failure"] is True
+    assert [order["product_id"] for order in place_orders_req["orders"]] == product_ids
+    assert [
+        order["signature"] for order in place_orders_req["orders"]
+    ] == expected_signatures
+    for order in place_orders_req["orders"]:
+        assert order["order"]["sender"].lower() == senders[0].lower()
+    assert [order.digest for order in res.data.place_orders] == ["0x1", "0x2"]
+
+
 def test_place_order_execute_provide_full_params(
-    mock_post: MagicMock, url: str, chain_id: int, private_keys: list[str]
+    mock_post: MagicMock,
+    url: str,
+    chain_id: int,
+    signer: LocalAccount,
+    ok_response: Callable[[dict], MagicMock],
 ):
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": "xxx",
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response({"status": "success", "signature": "xxx"})
 
     trigger_client = TriggerClient({"url": url})
-    signer: LocalAccount = Account.from_key(private_keys[0])
     sender = subaccount_to_bytes32(signer.address, "default")
     product_id = 1
     order_params = {
@@ -691,17 +741,15 @@ def test_place_trigger_order_complex_scenarios(senders: list[str]):
 
 
 def test_place_twap_order_entry_point(
-    trigger_client: TriggerClient, mock_post: MagicMock, senders: list[str]
+    trigger_client: TriggerClient,
+    mock_post: MagicMock,
+    senders: list[str],
+    ok_response: Callable[[dict], MagicMock],
 ):
     """Test the place_twap_order convenience method."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": "test_signature",
-        "data": None,
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response(
+        {"status": "success", "signature": "test_signature", "data": None}
+    )
 
     # Test basic TWAP order - using defaults for subaccount_owner and subaccount_name
     res = trigger_client.place_twap_order(
@@ -743,16 +791,15 @@ def test_place_twap_order_entry_point(
 
 
 def test_place_twap_order_with_custom_amounts(
-    trigger_client: TriggerClient, mock_post: MagicMock, senders: list[str]
+    trigger_client: TriggerClient,
+    mock_post: MagicMock,
+    senders: list[str],
+    ok_response: Callable[[dict], MagicMock],
 ):
     """Test TWAP order with custom amounts."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": "test_signature",
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response(
+        {"status": "success", "signature": "test_signature"}
+    )
 
     custom_amounts_x18 = [
         "400000000000000000",
@@ -790,16 +837,15 @@ def test_place_twap_order_with_custom_amounts(
 
 
 def test_place_twap_order_with_reduce_only(
-    trigger_client: TriggerClient, mock_post: MagicMock, senders: list[str]
+    trigger_client: TriggerClient,
+    mock_post: MagicMock,
+    senders: list[str],
+    ok_response: Callable[[dict], MagicMock],
 ):
     """Test TWAP order with reduce_only flag."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": "test_signature",
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response(
+        {"status": "success", "signature": "test_signature"}
+    )
 
     res = trigger_client.place_twap_order(
         product_id=1,
@@ -825,17 +871,15 @@ def test_place_twap_order_with_reduce_only(
 
 
 def test_place_price_trigger_order_entry_point(
-    trigger_client: TriggerClient, mock_post: MagicMock, senders: list[str]
+    trigger_client: TriggerClient,
+    mock_post: MagicMock,
+    senders: list[str],
+    ok_response: Callable[[dict], MagicMock],
 ):
     """Test the place_price_trigger_order convenience method."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": "test_signature",
-        "data": None,
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response(
+        {"status": "success", "signature": "test_signature", "data": None}
+    )
 
     # Test last_price_above trigger - using defaults
     res = trigger_client.place_price_trigger_order(
@@ -869,16 +913,15 @@ def test_place_price_trigger_order_entry_point(
 
 
 def test_place_price_trigger_order_all_trigger_types(
-    trigger_client: TriggerClient, mock_post: MagicMock, senders: list[str]
+    trigger_client: TriggerClient,
+    mock_post: MagicMock,
+    senders: list[str],
+    ok_response: Callable[[dict], MagicMock],
 ):
     """Test all supported price trigger types."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": "test_signature",
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response(
+        {"status": "success", "signature": "test_signature"}
+    )
 
     trigger_types = [
         "last_price_above",
@@ -915,16 +958,15 @@ def test_place_price_trigger_order_all_trigger_types(
 
 
 def test_place_price_trigger_order_with_reduce_only(
-    trigger_client: TriggerClient, mock_post: MagicMock, senders: list[str]
+    trigger_client: TriggerClient,
+    mock_post: MagicMock,
+    senders: list[str],
+    ok_response: Callable[[dict], MagicMock],
 ):
     """Test price trigger order with reduce_only flag."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": "test_signature",
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response(
+        {"status": "success", "signature": "test_signature"}
+    )
 
     res = trigger_client.place_price_trigger_order(
         product_id=1,
@@ -946,16 +988,15 @@ def test_place_price_trigger_order_with_reduce_only(
 
 
 def test_place_price_trigger_order_with_spot_leverage(
-    trigger_client: TriggerClient, mock_post: MagicMock, senders: list[str]
+    trigger_client: TriggerClient,
+    mock_post: MagicMock,
+    senders: list[str],
+    ok_response: Callable[[dict], MagicMock],
 ):
     """Test price trigger order with spot_leverage option."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": "test_signature",
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response(
+        {"status": "success", "signature": "test_signature"}
+    )
 
     res = trigger_client.place_price_trigger_order(
         product_id=1,
@@ -1041,16 +1082,15 @@ def test_place_twap_order_validation_errors(
 
 
 def test_entry_points_integration_flow(
-    trigger_client: TriggerClient, mock_post: MagicMock, senders: list[str]
+    trigger_client: TriggerClient,
+    mock_post: MagicMock,
+    senders: list[str],
+    ok_response: Callable[[dict], MagicMock],
 ):
     """Test realistic integration scenario using entry points."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": "test_signature",
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response(
+        {"status": "success", "signature": "test_signature"}
+    )
 
     # Scenario: Set up stop-loss and take-profit, then DCA with TWAP
 
@@ -1101,7 +1141,10 @@ def test_entry_points_integration_flow(
 
 
 def test_place_price_trigger_order_appendix_validation(
-    trigger_client: TriggerClient, mock_post: MagicMock, senders: list[str]
+    trigger_client: TriggerClient,
+    mock_post: MagicMock,
+    senders: list[str],
+    ok_response: Callable[[dict], MagicMock],
 ):
     """Test that place_price_trigger_order correctly builds the appendix with PRICE trigger type."""
     from nado_protocol.utils.order import (
@@ -1112,13 +1155,9 @@ def test_place_price_trigger_order_appendix_validation(
     )
     from nado_protocol.utils.expiration import OrderType
 
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": "success",
-        "signature": "test_signature",
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = ok_response(
+        {"status": "success", "signature": "test_signature"}
+    )
 
     # Test with DEFAULT order type and reduce_only=False
     res = trigger_client.place_price_trigger_order(
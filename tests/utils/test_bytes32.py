@@ -0,0 +1,39 @@
+import pytest
+
+from nado_protocol.utils.bytes32 import (
+    hex_to_bytes,
+    hex_to_bytes32,
+    subaccount_to_bytes32,
+    zero_subaccount,
+)
+from nado_protocol.utils.subaccount import SubaccountParams
+
+
+@pytest.mark.parametrize(
+    "input, size, expected",
+    [
+        ("0x0102", 4, b"\x01\x02\x00\x00"),
+        ("0102", 4, b"\x01\x02\x00\x00"),
+        ("0x01020304", 4, b"\x01\x02\x03\x04"),
+        ("0x0102030405", 4, b"\x01\x02\x03\x04\x05"),
+        (b"\x01", 4, b"\x01"),
+        ("\x00" * 32, 32, zero_subaccount()),
+    ],
+)
+def test_hex_to_bytes(input, size: int, expected: bytes):
+    assert hex_to_bytes(input, size) == expected
+
+
+def test_subaccount_to_bytes32(senders: list[str]):
+    owner = senders[0][:42]
+    expected = hex_to_bytes32(owner + b"default".hex())
+
+    assert subaccount_to_bytes32(owner, "default") == expected
+    assert (
+        subaccount_to_bytes32(
+            SubaccountParams(subaccount_owner=owner, subaccount_name="default")
+        )
+        == expected
+    )
+    assert subaccount_to_bytes32(expected) is expected
+    assert len(expected) == 32
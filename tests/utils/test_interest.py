@@ -0,0 +1,50 @@
+from nado_protocol.engine_client.types.models import (
+    SpotProduct,
+    SpotProductConfig,
+    SpotProductState,
+)
+from nado_protocol.utils.interest import (
+    calc_borrow_rate_in_period,
+    calc_deposit_and_borrow_rates_in_period,
+    calc_deposit_rate_in_period,
+)
+from nado_protocol.utils.math import to_x18
+from nado_protocol.utils.time import TimeInSeconds
+
+
+def _spot_product(total_deposits: float, total_borrows: float) -> SpotProduct:
+    return SpotProduct.model_construct(
+        product_id=1,
+        config=SpotProductConfig(
+            token="0x" + "0" * 40,
+            interest_inflection_util_x18=str(to_x18(0.8)),
+            interest_floor_x18=str(to_x18(0.01)),
+            interest_small_cap_x18=str(to_x18(0.04)),
+            interest_large_cap_x18=str(to_x18(1)),
+            withdraw_fee_x18="0",
+            min_deposit_rate_x18="0",
+        ),
+        state=SpotProductState(
+            cumulative_deposits_multiplier_x18=str(to_x18(1)),
+            cumulative_borrows_multiplier_x18=str(to_x18(1)),
+            total_deposits_normalized=str(to_x18(total_deposits)),
+            total_borrows_normalized=str(to_x18(-total_borrows)),
+        ),
+    )
+
+
+def test_calc_deposit_and_borrow_rates_in_period():
+    # Below and above the inflection utilization
+    for product in [_spot_product(1000, 500), _spot_product(1000, 900)]:
+        deposit_rate, borrow_rate = calc_deposit_and_borrow_rates_in_period(
+            product, TimeInSeconds.YEAR, 0.2
+        )
+        assert deposit_rate == calc_deposit_rate_in_period(
+            product, TimeInSeconds.YEAR, 0.2
+        )
+        assert borrow_rate == calc_borrow_rate_in_period(product, TimeInSeconds.YEAR)
+        assert 0 < deposit_rate < borrow_rate
+
+    assert calc_deposit_and_borrow_rates_in_period(
+        _spot_product(1000, 0), TimeInSeconds.YEAR, 0.2
+    ) == (0, 0)
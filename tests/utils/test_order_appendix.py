@@ -13,7 +13,9 @@ from nado_protocol.utils.order import (
     order_trigger_type,
     order_twap_data,
     order_version,
+    pack_appendices,
     pack_twap_appendix_value,
+    unpack_appendices,
     unpack_twap_appendix_value,
 )
 from nado_protocol.utils.expiration import OrderType
@@ -351,6 +353,19 @@ def test_isolated_and_twap_mutual_exclusion():
         )
 
 
+def test_build_appendix_memoized():
+    """Test that repeated appendix builds are served from the cache."""
+    appendix = build_appendix(OrderType.POST_ONLY, reduce_only=True)
+    hits = build_appendix.cache_info().hits
+    assert build_appendix(OrderType.POST_ONLY, reduce_only=True) == appendix
+    assert build_appendix.cache_info().hits == hits + 1
+
+    # Invalid parameters are not cached and keep raising
+    for _ in range(2):
+        with pytest.raises(ValueError, match="isolated_margin can only be set"):
+            build_appendix(OrderType.DEFAULT, isolated_margin=to_x6(1))
+
+
 def test_typescript_basic_appendix_compatibility():
     """Test that our values match TypeScript SDK for basic appendix."""
     appendix = build_appendix(
@@ -565,3 +580,40 @@ def test_twap_minimum_values():
     extracted_times, extracted_slippage = twap_data
     assert extracted_times == times
     assert abs(extracted_slippage - slippage) < 1e-6
+
+
+def test_pack_appendices_round_trip():
+    """Test columnar packing of many appendices."""
+    appendices = [
+        build_appendix(OrderType.DEFAULT),
+        build_appendix(OrderType.POST_ONLY, reduce_only=True),
+        build_appendix(
+            OrderType.IOC, isolated=True, isolated_margin=AppendixBitFields.VALUE_MASK
+        ),
+        build_appendix(
+            OrderType.IOC,
+            trigger_type=OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS,
+            twap_times=500,
+            twap_slippage_frac=0.05,
+        ),
+    ]
+
+    flags, values = pack_appendices(appendices)
+    assert flags.typecode == "H"
+    assert values.typecode == "Q"
+    assert len(flags) == len(values) == len(appendices)
+    assert unpack_appendices(flags, values) == appendices
+
+
+def test_pack_appendices_invalid():
+    """Test columnar packing rejects values it cannot represent."""
+    with pytest.raises(ValueError, match="cannot be packed"):
+        pack_appendices([1 << AppendixBitFields.RESERVED_SHIFT])
+
+    with pytest.raises(ValueError, match="cannot be packed"):
+        pack_appendices([1 << 128])
+
+    flags, values = pack_appendices([build_appendix(OrderType.DEFAULT)])
+    values.append(0)
+    with pytest.raises(ValueError, match="length mismatch"):
+        unpack_appendices(flags, values)
@@ -4,6 +4,7 @@ from nado_protocol.utils.twap import (
     validate_twap_order,
     estimate_twap_completion_time,
     calculate_equal_amounts,
+    twap_schedule,
 )
 from nado_protocol.utils.order import (
     OrderAppendixTriggerType,
@@ -88,6 +89,11 @@ def test_validate_twap_order_equal_distribution():
     with pytest.raises(ValueError, match="must be divisible"):
         validate_twap_order("1001", 5)
 
+    # Pre-parsed integers are accepted as-is
+    validate_twap_order(1000, 5)
+    with pytest.raises(ValueError, match="must be divisible"):
+        validate_twap_order(1001, 5)
+
 
 def test_validate_twap_order_custom_amounts():
     """Test TWAP validation for custom amounts."""
@@ -114,6 +120,23 @@ def test_estimate_twap_completion_time():
     assert time == 0
 
 
+def test_twap_schedule():
+    """Test computing per-execution timestamps for a TWAP order."""
+    assert twap_schedule(1700000000, 4, 300) == [
+        1700000000,
+        1700000300,
+        1700000600,
+        1700000900,
+    ]
+
+    # Last execution lines up with the estimated completion time
+    schedule = twap_schedule(1700000000, 5, 60)
+    assert schedule[-1] - schedule[0] == estimate_twap_completion_time(5, 60)
+
+    with pytest.raises(ValueError, match="Interval must be positive"):
+        twap_schedule(1700000000, 5, 0)
+
+
 def test_calculate_equal_amounts():
     """Test calculating equal amounts for TWAP executions."""
     amounts = calculate_equal_amounts("1000", 5)